@@ -4,15 +4,28 @@ MatVerse Dual-Brain Watcher
 Monitora TeraBox + Google Drive → Cria embeddings únicos → Upsert Qdrant
 """
 
+import io
 import os
 import time
 import hashlib
-import json
+import threading
+import numpy as np
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dumps(payload):
+    """Serializa payload com orjson (aceita arrays numpy direto)"""
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
 class DualBrainWatcher(FileSystemEventHandler):
     """
     Monitora TeraBox + GDrive → Cria embeddings únicos → Upsert Qdrant
@@ -24,22 +37,35 @@ class DualBrainWatcher(FileSystemEventHandler):
     COLLECTION = "dual_brain"
     EXTENSIONS = (".txt", ".md", ".py", ".js", ".sol", ".yaml", ".json", ".rs", ".go")
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    MIN_FILE_SIZE = 4  # menor que isso não vale um embedding
+    PROBE_SIZE = 256  # bytes por leitura do probe, até o primeiro byte não-branco
+    SCAN_WORKERS = (os.cpu_count() or 1) * 4  # I/O-bound (Ollama + Qdrant)
 
     def __init__(self):
         self.seen_hashes = set()
+        self.seen_lock = threading.Lock()
+        self.session = requests.Session()
+        self.session.headers.update(JSON_HEADERS)
+        adapter = HTTPAdapter(pool_maxsize=self.SCAN_WORKERS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.qdrant_init()
 
     def qdrant_init(self):
         """Cria collection se não existir"""
         try:
-            requests.put(
+            self.session.put(
                 f"{self.QDRANT}/collections/{self.COLLECTION}",
-                json={
+                data=dumps({
                     "vectors": {
                         "size": 1536,  # text-embedding-3-small
                         "distance": "Cosine"
+                    },
+                    # int8 em RAM: ~4× menos memória no Qdrant
+                    "quantization_config": {
+                        "scalar": {"type": "int8", "always_ram": True}
                     }
-                }
+                })
             )
             print(f"✓ Qdrant collection '{self.COLLECTION}' pronta")
         except Exception as e:
@@ -56,16 +82,16 @@ class DualBrainWatcher(FileSystemEventHandler):
         """
         # Tenta Ollama primeiro (zero-cost)
         try:
-            response = requests.post(
+            response = self.session.post(
                 "http://localhost:11434/api/embeddings",
-                json={
+                data=dumps({
                     "model": "nomic-embed-text",
                     "prompt": text[:8000]
-                },
+                }),
                 timeout=30
             )
             if response.status_code == 200:
-                return response.json()["embedding"]
+                return orjson.loads(response.content)["embedding"]
         except:
             pass
 
@@ -78,34 +104,47 @@ class DualBrainWatcher(FileSystemEventHandler):
                 vector[i] = hash(word) % 100 / 100.0
         return vector
 
-    def upsert_file(self, path):
+    def upsert_file(self, path, size=None):
         """Le arquivo → embedding → upsert Qdrant"""
         try:
-            # Verificar tamanho
-            if os.path.getsize(path) > self.MAX_FILE_SIZE:
+            # Verificar tamanho (stat do scandir quando disponível)
+            if size is None:
+                size = os.path.getsize(path)
+            if size > self.MAX_FILE_SIZE:
                 print(f"⚠️ Arquivo muito grande, ignorando: {path}")
                 return
+            if size < self.MIN_FILE_SIZE:
+                return  # arquivo vazio
 
             # 1. Hash do path
             file_id = self.get_file_hash(path)
 
-            if file_id in self.seen_hashes:
-                return  # já indexado
+            with self.seen_lock:
+                if file_id in self.seen_hashes:
+                    return  # já indexado
 
-            # 2. Le conteúdo
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            # 2. Le conteúdo: probe binário para no primeiro byte não-branco,
+            # então arquivo só de espaços nunca é decodificado
+            with open(path, 'rb') as f:
+                while True:
+                    chunk = f.read(self.PROBE_SIZE)
+                    if not chunk:
+                        return  # só espaços
+                    if not chunk.isspace():
+                        break
+                f.seek(0)
+                content = io.TextIOWrapper(f, encoding='utf-8', errors='ignore').read()
 
-            if not content.strip():
-                return  # arquivo vazio
+            if not content or content.isspace():
+                return  # só espaços Unicode ou bytes inválidos
 
-            # 3. Embedding
-            vector = self.embed(content)
+            # 3. Embedding (float32 = metade dos caracteres do float64 no JSON)
+            vector = np.asarray(self.embed(content), dtype=np.float32)
 
             # 4. Upsert
-            requests.put(
+            self.session.put(
                 f"{self.QDRANT}/collections/{self.COLLECTION}/points",
-                json={
+                data=dumps({
                     "points": [{
                         "id": file_id,
                         "vector": vector,
@@ -118,10 +157,11 @@ class DualBrainWatcher(FileSystemEventHandler):
                             "extension": Path(path).suffix
                         }
                     }]
-                }
+                })
             )
 
-            self.seen_hashes.add(file_id)
+            with self.seen_lock:
+                self.seen_hashes.add(file_id)
             print(f"✓ Indexed: {Path(path).name} ({len(content)} bytes)")
 
         except Exception as e:
@@ -138,14 +178,29 @@ class DualBrainWatcher(FileSystemEventHandler):
         if not event.is_directory and event.src_path.endswith(self.EXTENSIONS):
             # Remove hash antigo para forçar re-index
             file_id = self.get_file_hash(event.src_path)
-            self.seen_hashes.discard(file_id)
+            with self.seen_lock:
+                self.seen_hashes.discard(file_id)
             print(f"✏️ Modificado: {event.src_path}")
             self.upsert_file(event.src_path)
 
+    def iter_files(self, root):
+        """Walker com os.scandir → (path, size) sem stat extra por arquivo"""
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file() and entry.name.endswith(self.EXTENSIONS):
+                            yield entry.path, entry.stat().st_size
+            except OSError as e:
+                print(f"⚠️ Erro lendo diretório: {e}")
+
     def initial_scan(self):
         """Scan inicial das duas clouds"""
         print("🔍 Scanning inicial...")
-        total_files = 0
+        files = []
 
         for root in self.ROOTS:
             if not os.path.exists(root):
@@ -153,14 +208,18 @@ class DualBrainWatcher(FileSystemEventHandler):
                 continue
 
             print(f"📁 Scanning: {root}")
-            for path in Path(root).rglob("*"):
-                if path.is_file() and str(path).endswith(self.EXTENSIONS):
-                    self.upsert_file(path)
-                    total_files += 1
+            files.extend(self.iter_files(root))
+
+        # Upserts em paralelo: o trabalho é quase todo socket I/O
+        total_files = 0
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as executor:
+            paths, sizes = zip(*files) if files else ((), ())
+            for _ in executor.map(self.upsert_file, paths, sizes):
+                total_files += 1
 
-                    # Progress indicator
-                    if total_files % 100 == 0:
-                        print(f"  ... {total_files} arquivos processados")
+                # Progress indicator
+                if total_files % 100 == 0:
+                    print(f"  ... {total_files} arquivos processados")
 
         print(f"✓ Scan completo: {len(self.seen_hashes)} arquivos indexados")
 
@@ -179,14 +238,15 @@ def query_dual_brain(question, top_k=5):
     try:
         response = requests.post(
             "http://localhost:6333/collections/dual_brain/points/search",
-            json={
-                "vector": vec,
+            data=dumps({
+                "vector": np.asarray(vec, dtype=np.float32),
                 "limit": top_k,
                 "with_payload": True
-            }
+            }),
+            headers=JSON_HEADERS
         )
 
-        results = response.json()["result"]
+        results = orjson.loads(response.content)["result"]
 
         # 3. Retorna contexto unificado
         contexts = []
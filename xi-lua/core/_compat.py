@@ -0,0 +1,30 @@
+"""
+Shared compatibility helpers (optional dependencies, Python 3.8 dataclasses)
+
+Part of Ξ-LUA v2.0 SuperProject
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: run the kernels as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]  # bare @njit
+        return lambda fn: fn
+
+
+class FrozenSlotsPickleMixin:
+    """
+    Pickle/deepcopy support for @dataclass(frozen=True) with __slots__
+
+    Without __dict__, the default protocol restores state through the frozen
+    __setattr__ and fails; state is a tuple in __slots__ order instead.
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
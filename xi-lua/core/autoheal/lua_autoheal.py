@@ -14,16 +14,29 @@ Part of Ξ-LUA v2.0 SuperProject
 
 import os
 import time
+import atexit
+import weakref
 import hashlib
 import hmac
 import json
 import secrets
 import base64
+import mmap
+import struct
+import numpy as np
+import orjson
 from datetime import datetime, timedelta
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 from typing import Dict, List, Optional, Tuple
 import threading
 import logging
+from collections import namedtuple
+from itertools import islice
+
+try:
+    from blake3 import blake3
+except ImportError:  # blake3 is optional: new entries keep SHA-3
+    blake3 = None
 
 # Configure logging
 logging.basicConfig(
@@ -33,50 +46,301 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Canonical entry encoding, stored per entry as 'schema' (absent = 1):
+#   1: json.dumps(sort_keys=True) - chains written before orjson
+#   2: orjson with sorted keys
+#   3: orjson with sorted keys, rooted with BLAKE3 instead of SHA3-256
+CHAIN_SCHEMA = 3 if blake3 is not None else 2
+# Metadata may carry numpy values (np.float64, np.int64, np.bool_ ...), which
+# json.dumps partly accepted and orjson rejects without these options
+_ORJSON_METADATA = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+_ORJSON_CANONICAL = orjson.OPT_SORT_KEYS | _ORJSON_METADATA
+
+
+def _orjson_default(obj):
+    """Fallback for numpy scalars orjson does not serialize natively"""
+    if isinstance(obj, np.floating):  # float16, longdouble: .item() may stay numpy
+        return float(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Sorted-key layout of a schema >= 2 body: byte-identical to
+# orjson.dumps(body, OPT_SORT_KEYS) without building or sorting a dict
+_ENTRY_TEMPLATE = b'{"event":%b,"metadata":%b,"prev_root":%b,"schema":%b,"timestamp":%b}'
+
+
+def _canonical_entry(entry: Dict) -> bytes:
+    """Canonical bytes of a chain entry (everything but merkle_root)"""
+    schema = entry.get('schema', 1)
+    if schema == 1:
+        body = {
+            'timestamp': entry['timestamp'],
+            'event': entry['event'],
+            'metadata': entry['metadata'],
+            'prev_root': entry['prev_root']
+        }
+        return json.dumps(body, sort_keys=True).encode('utf-8')
+
+    dumps = orjson.dumps
+    metadata = entry['metadata']
+    return _ENTRY_TEMPLATE % (
+        dumps(entry['event']),
+        b'{}' if metadata == {} else dumps(metadata, default=_orjson_default,
+                                           option=_ORJSON_CANONICAL),
+        dumps(entry['prev_root']),
+        dumps(schema),
+        dumps(entry['timestamp'])
+    )
+
+
+# Binary log: magic, then per entry a fixed header (roots as raw 32 bytes)
+# followed by timestamp | event | metadata (orjson). Schema 1 = legacy entry.
+_LOG_MAGIC = b'XLMC\x00\x01'
+_RECORD = struct.Struct('<BBII32s32s')  # schema, ts/event/meta lengths, prev, root
+
+
+def _encode_record(entry: Dict) -> bytes:
+    """Pack a chain entry into its on-disk binary record"""
+    timestamp = entry['timestamp'].encode('utf-8')
+    event = entry['event'].encode('utf-8')
+    metadata = orjson.dumps(entry['metadata'], default=_orjson_default, option=_ORJSON_METADATA)
+    return _RECORD.pack(
+        entry.get('schema', 1), len(timestamp), len(event), len(metadata),
+        bytes.fromhex(entry['prev_root']), bytes.fromhex(entry['merkle_root'])
+    ) + timestamp + event + metadata
+
+
+def _decode_records(buf) -> Tuple[List[Dict], int]:
+    """
+    Unpack every complete binary record after the magic header
+
+    Returns:
+        (chain, end offset of the last complete record)
+    """
+    chain = []
+    unpack_from = _RECORD.unpack_from
+    header = _RECORD.size
+    offset, end = len(_LOG_MAGIC), len(buf)
+
+    while offset + header <= end:
+        schema, ts_len, event_len, meta_len, prev_root, merkle_root = unpack_from(buf, offset)
+        start = offset + header
+        event_at = start + ts_len
+        meta_at = event_at + event_len
+        stop = meta_at + meta_len
+        if stop > end:
+            break
+
+        entry = {
+            'timestamp': buf[start:event_at].decode('utf-8'),
+            'event': buf[event_at:meta_at].decode('utf-8'),
+            'metadata': orjson.loads(buf[meta_at:stop]),
+            'prev_root': prev_root.hex()
+        }
+        if schema != 1:
+            entry['schema'] = schema
+        entry['merkle_root'] = merkle_root.hex()
+        chain.append(entry)
+        offset = stop
+
+    return chain, offset
+
 
 class MerkleChainLogger:
     """Immutable logging with Merkle chain"""
 
+    DEFAULT_LOG_FILE = '~/.xi-lua/autoheal.log'
+    FSYNC_INTERVAL = 1.0  # Seconds between background fsyncs
+
+    # Loggers sharing a path must be one instance: each keeps its own chain
+    # head, so two of them would fork the log (and double the fd/fsync thread)
+    _shared: Dict[str, 'MerkleChainLogger'] = {}
+    _shared_lock = threading.Lock()
+    _open: 'weakref.WeakSet[MerkleChainLogger]' = weakref.WeakSet()  # Closed at exit
+
+    @classmethod
+    def shared(cls, log_file: str = None) -> 'MerkleChainLogger':
+        """Process-wide logger for log_file (default: DEFAULT_LOG_FILE)"""
+        path = os.path.abspath(log_file or os.path.expanduser(cls.DEFAULT_LOG_FILE))
+        with cls._shared_lock:
+            chain_logger = cls._shared.get(path)
+            if chain_logger is None or chain_logger.closed:
+                chain_logger = cls._shared[path] = cls(path)
+            return chain_logger
+
     def __init__(self, log_file: str = None):
-        self.log_file = log_file or os.path.expanduser('~/.xi-lua/autoheal.log')
+        self.log_file = log_file or os.path.expanduser(self.DEFAULT_LOG_FILE)
         self.chain: List[Dict] = []
         self.current_root = "0" * 64  # Genesis root
 
+        # Verification frontier: chain[:_verified_upto] is known good
+        self._verified_upto = 0
+        self._running_root = "0" * 64
+
         # Create log directory
         os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
 
-        # Load existing chain
+        # Load existing chain (may clear _persist if the log is unusable)
+        self._persist = True
         self._load_chain()
 
+        # Persistent append-only fd; fsync is batched by a background thread
+        self._fd: Optional[int] = None
+        if self._persist:
+            self._fd = os.open(self.log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            if os.fstat(self._fd).st_size == 0:
+                os.write(self._fd, _LOG_MAGIC)
+        self._lock = threading.RLock()  # Serializes appends (chain head + fd) and close
+        self._dirty = threading.Event()
+        self._closed = threading.Event()
+        self._fsync_thread: Optional[threading.Thread] = None
+        MerkleChainLogger._open.add(self)
+
     def _load_chain(self):
-        """Load existing Merkle chain from disk"""
-        if os.path.exists(self.log_file):
+        """Load existing Merkle chain from disk (binary, or legacy JSON lines)"""
+        if not os.path.exists(self.log_file) or os.path.getsize(self.log_file) == 0:
+            return
+
+        try:
+            with open(self.log_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                size = len(buf)
+                legacy = buf[:len(_LOG_MAGIC)] != _LOG_MAGIC
+                if legacy:
+                    self.chain = [orjson.loads(line) for line in iter(buf.readline, b'')
+                                  if line.strip()]
+                else:
+                    self.chain, end = _decode_records(buf)
+            if not legacy and end != size:
+                # Torn write from a crash: drop it so new records stay aligned
+                logger.warning(f"Truncating partial record at byte {end} of chain log")
+                os.truncate(self.log_file, end)
+            if self.chain:
+                self.current_root = self.chain[-1]['merkle_root']
+            if legacy:
+                self._migrate_to_binary()
+        except Exception as e:
+            self._quarantine(e)
+
+    def _quarantine(self, error: Exception):
+        """
+        Move an unreadable log aside and start a fresh chain
+
+        Appending binary records to a file that failed to load (e.g. a
+        legacy log that could not be parsed or migrated) would make it
+        unreadable for good, so it is kept untouched as <log>.corrupt
+        """
+        self.chain = []
+        self.current_root = "0" * 64
+
+        corrupt_file = f"{self.log_file}.corrupt"
+        if os.path.exists(corrupt_file):
+            corrupt_file = f"{corrupt_file}.{time.time_ns()}"
+        try:
+            os.replace(self.log_file, corrupt_file)
+        except OSError as e:
+            # Read-only or cross-device: startup must not fail, and the
+            # unreadable log must not be appended to, so keep it in memory
+            self._persist = False
+            logger.error(f"Failed to load chain ({error}) or move it aside ({e}); "
+                         f"new entries are kept in memory only")
+            return
+
+        tmp_file = self.log_file + '.tmp'
+        try:
+            os.unlink(tmp_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove {tmp_file}: {e}")
+
+        logger.error(f"Failed to load chain ({error}); moved to {corrupt_file}, starting a new log")
+
+    def _migrate_to_binary(self):
+        """Rewrite a legacy JSON-lines log in the binary format (atomic replace)"""
+        tmp_file = self.log_file + '.tmp'
+        with open(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            f.write(_LOG_MAGIC)
+            f.writelines(_encode_record(entry) for entry in self.chain)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.log_file)
+        logger.info(f"Migrated {len(self.chain)} chain entries to binary log")
+
+    def _fsync_loop(self):
+        """Background thread: fsync at most once per interval while dirty"""
+        while not self._closed.is_set():
+            self._dirty.wait()
+            self._closed.wait(self.FSYNC_INTERVAL)
+            self._dirty.clear()
+            self.flush()
+
+    def flush(self):
+        """Force pending log lines to stable storage"""
+        with self._lock:
+            if self._fd is None:
+                return
             try:
-                with open(self.log_file, 'r') as f:
-                    self.chain = [json.loads(line) for line in f]
-                if self.chain:
-                    self.current_root = self.chain[-1]['merkle_root']
-            except Exception as e:
-                logger.warning(f"Failed to load chain: {e}")
-
-    def _compute_hash(self, data: str, prev_root: str) -> str:
-        """Compute SHA-3 hash of data + previous root"""
-        combined = f"{data}|{prev_root}".encode('utf-8')
+                os.fsync(self._fd)
+            except OSError as e:
+                logger.warning(f"Failed to fsync chain: {e}")
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def close(self):
+        """Stop the fsync thread, fsync pending records and close the log fd"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._dirty.set()  # Wake the fsync thread so it can exit
+        if self._fsync_thread is not None and self._fsync_thread is not threading.current_thread():
+            self._fsync_thread.join()
+
+        with self._lock:
+            self.flush()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        MerkleChainLogger._open.discard(self)
+
+    def _compute_hash(self, data: bytes, prev_root: str, schema: int = CHAIN_SCHEMA) -> str:
+        """Compute hash of data + previous root (BLAKE3 from schema 3, else SHA-3)"""
+        if schema >= 3:
+            hasher = blake3(data)
+            hasher.update(b'|')
+            hasher.update(prev_root.encode('utf-8'))
+            return hasher.hexdigest()
+        combined = data + b'|' + prev_root.encode('utf-8')
         return hashlib.sha3_256(combined).hexdigest()
 
     def append(self, event: str, metadata: Dict = None):
         """Append event to Merkle chain"""
+        with self._lock:
+            if self._closed.is_set():
+                raise ValueError(f"Chain log is closed: {self.log_file}")
+            new_root = self._append(event, metadata)
+
+        logger.info(f"{event} [Root: {new_root[:10]}...]")
+
+        return new_root
+
+    def _append(self, event: str, metadata: Optional[Dict]) -> str:
+        """Hash, record and write one entry (caller holds _lock)"""
         timestamp = datetime.utcnow().isoformat()
         entry = {
             'timestamp': timestamp,
             'event': event,
             'metadata': metadata or {},
-            'prev_root': self.current_root
+            'prev_root': self.current_root,
+            'schema': CHAIN_SCHEMA
         }
 
         # Compute new Merkle root
-        entry_str = json.dumps(entry, sort_keys=True)
-        new_root = self._compute_hash(entry_str, self.current_root)
+        new_root = self._compute_hash(_canonical_entry(entry), self.current_root)
         entry['merkle_root'] = new_root
 
         # Update current root
@@ -85,30 +349,57 @@ class MerkleChainLogger:
         # Append to chain
         self.chain.append(entry)
 
-        # Persist to disk
-        with open(self.log_file, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+        # Entry hashed here is valid by construction: advance frontier
+        if self._verified_upto == len(self.chain) - 1:
+            self._verified_upto += 1
+            self._running_root = new_root
 
-        logger.info(f"{event} [Root: {new_root[:10]}...]")
+        # Persist to disk (single write syscall, fsync deferred)
+        if self._fd is None:
+            return new_root  # In-memory chain: the log on disk was unusable
+        os.write(self._fd, _encode_record(entry))
+        self._dirty.set()
+        if self._fsync_thread is None:
+            self._fsync_thread = threading.Thread(target=self._fsync_loop, daemon=True)
+            self._fsync_thread.start()
 
         return new_root
 
-    def verify_integrity(self) -> bool:
-        """Verify entire chain integrity"""
+    def verify_integrity(self, incremental: bool = False) -> bool:
+        """
+        Verify chain integrity
+
+        Args:
+            incremental: Only replay entries past the last verified index,
+                starting from the cached running root (cheap status polls)
+        """
         if not self.chain:
             return True
 
-        current_root = "0" * 64
-        for entry in self.chain:
-            # Recreate entry without merkle_root for verification
-            verify_entry = {
-                'timestamp': entry['timestamp'],
-                'event': entry['event'],
-                'metadata': entry['metadata'],
-                'prev_root': entry['prev_root']
-            }
-            entry_str = json.dumps(verify_entry, sort_keys=True)
-            expected_root = self._compute_hash(entry_str, current_root)
+        if incremental:
+            start, current_root = self._verified_upto, self._running_root
+        else:
+            start, current_root = 0, "0" * 64
+
+        # Replay is a tight loop of small hashes: bind callables once and
+        # inline _compute_hash so per-entry cost is the C calls themselves
+        sha3_256 = hashlib.sha3_256
+        canonical = _canonical_entry
+
+        for entry in islice(self.chain, start, None):
+            # Re-encode entry without merkle_root for verification
+            data = canonical(entry)
+            prev = current_root.encode('utf-8')
+            if entry.get('schema', 1) >= 3:
+                if blake3 is None:
+                    logger.error("blake3 package required to verify schema 3 entries")
+                    return False
+                hasher = blake3(data)
+                hasher.update(b'|')
+                hasher.update(prev)
+                expected_root = hasher.hexdigest()
+            else:
+                expected_root = sha3_256(data + b'|' + prev).hexdigest()
 
             if expected_root != entry['merkle_root']:
                 logger.error(f"Chain integrity violation at {entry['timestamp']}")
@@ -116,30 +407,88 @@ class MerkleChainLogger:
 
             current_root = entry['merkle_root']
 
+        self._verified_upto = len(self.chain)
+        self._running_root = current_root
         return True
 
 
+@atexit.register
+def _close_chain_loggers():
+    """Fsync records still waiting on the batched fsync before exit"""
+    for chain_logger in list(MerkleChainLogger._open):
+        chain_logger.close()
+
+
+# Ephemeral-key AEAD backends (both: 32-byte key, 12-byte nonce)
+AEAD_BACKENDS = {
+    'aes-gcm': AESGCM,
+    'chacha20-poly1305': ChaCha20Poly1305
+}
+
+
+# CPU feature the AEAD choice depends on (same 'aes' flag on x86 and ARM)
+_CRYPTO_FLAGS = frozenset({'aes'})
+
+
+def _detect_cpu() -> Optional[frozenset]:
+    """Crypto feature flags from /proc/cpuinfo (None when unavailable)"""
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith(('flags', 'Features')):
+                    return frozenset(line.partition(':')[2].split()) & _CRYPTO_FLAGS
+    except OSError:
+        pass
+    return None
+
+
+# Probed once at import. OpenSSL (behind AESGCM) picks its own AES-NI or
+# VAES+VPCLMULQDQ code path; without AES hardware, ChaCha20 is faster.
+# Unknown platform: assume AES hardware.
+CPU_CAPS = _detect_cpu()
+AEAD_BACKEND = 'aes-gcm' if CPU_CAPS is None or 'aes' in CPU_CAPS else 'chacha20-poly1305'
+
+
 class EphemeralKeyManager:
     """
     Manages ephemeral keys with 5-minute rotation
 
-    Uses AES-256-GCM for encryption (quantum-resistant symmetric crypto)
+    Uses AES-256-GCM for encryption (quantum-resistant symmetric crypto),
+    or ChaCha20-Poly1305 on CPUs without AES hardware (same 32-byte key,
+    12-byte nonce interface)
     Key derivation: HKDF with SHA-3
     Nonce: 96-bit random (cryptographically secure)
     """
 
-    def __init__(self, rotation_interval: int = 300):  # 300 seconds = 5 minutes
+    NONCE_POOL_SIZE = 256  # GCM nonces drawn per getrandom call
+    PRECOMPUTE_AT = 0.9  # Fraction of the interval when the next key is derived
+
+    def __init__(self, rotation_interval: int = 300,  # 300 seconds = 5 minutes
+                 backend: str = AEAD_BACKEND):
+        """
+        Args:
+            rotation_interval: Key lifetime in seconds
+            backend: 'aes-gcm' or 'chacha20-poly1305' (default: by CPU)
+        """
         self.rotation_interval = rotation_interval
-        self.current_key: Optional[bytes] = None
-        self.current_aesgcm: Optional[AESGCM] = None
-        self.key_created_at: Optional[datetime] = None
+        self.backend = backend
+        self.cipher_cls = AEAD_BACKENDS[backend]
+        # Current key epoch, replaced as one immutable tuple on rotation:
+        # (cipher, key, hmac_template, created_at_monotonic_ns)
+        self._epoch: Optional[Tuple] = None
+        self.key_created_at: Optional[datetime] = None  # Wall clock, for logs
         self.rotation_count = 0
-        self.logger = MerkleChainLogger()
+        self.logger = MerkleChainLogger.shared()
 
         # Master key path (persistent across rotations)
         self.master_key_path = os.path.expanduser('~/.xi-lua/master.key')
         self.master_key = self._ensure_master_key()
 
+        # Pre-drawn random nonces, handed out 12 bytes at a time
+        self._nonce_lock = threading.Lock()
+        self._nonce_pool = b''
+        self._nonce_pos = 0
+
         # Generate initial key
         self._rotate_key()
 
@@ -182,15 +531,33 @@ class EphemeralKeyManager:
         combined = self.master_key + salt
         return hashlib.sha3_256(combined).digest()
 
-    def _rotate_key(self):
-        """Generate new ephemeral key via derivation"""
+    def _prepare_key(self) -> Tuple:
+        """
+        Derive the next key epoch without installing it
+
+        Returns:
+            (salt, key, cipher, hmac_template)
+        """
         # Generate random salt
-        salt = secrets.token_bytes(32)
+        salt = os.urandom(32)
 
-        # Derive new key
+        # Derive new key + cipher and keyed HMAC state (pads absorbed once
+        # per key, cloned per call)
         new_key = self._derive_ephemeral_key(salt)
-        self.current_key = new_key
-        self.current_aesgcm = AESGCM(new_key)
+        return (
+            salt,
+            new_key,
+            self.cipher_cls(new_key),
+            hmac.new(new_key, digestmod=hashlib.sha3_256)
+        )
+
+    def _rotate_key(self, prepared: Optional[Tuple] = None):
+        """Install a new ephemeral key (derived now unless precomputed)"""
+        salt, new_key, cipher, hmac_template = prepared or self._prepare_key()
+        self._epoch = (cipher, new_key, hmac_template, time.monotonic_ns())
+        # Fresh nonce pool per key epoch
+        with self._nonce_lock:
+            self._nonce_pos = len(self._nonce_pool)
         self.key_created_at = datetime.utcnow()
         self.rotation_count += 1
 
@@ -207,34 +574,68 @@ class EphemeralKeyManager:
         )
 
     def _rotation_loop(self):
-        """Background thread for automatic key rotation"""
+        """
+        Background thread for automatic key rotation
+
+        The next key is derived at PRECOMPUTE_AT of the interval and only
+        swapped in on expiry, so derivation never runs on the data path.
+        """
+        lead = self.rotation_interval * self.PRECOMPUTE_AT
         while True:
-            time.sleep(self.rotation_interval)
-            self._rotate_key()
+            time.sleep(lead)
+            prepared = self._prepare_key()
+            time.sleep(self.rotation_interval - lead)
+            self._rotate_key(prepared)
+
+    @property
+    def current_aesgcm(self) -> AESGCM:
+        """AEAD cipher of the current key epoch"""
+        return self._epoch[0]
+
+    @property
+    def current_key(self) -> bytes:
+        """Raw bytes of the current ephemeral key"""
+        return self._epoch[1]
+
+    @property
+    def key_created_at_ns(self) -> int:
+        """Monotonic creation time of the current key, for age checks"""
+        return self._epoch[3]
+
+    def _next_nonce(self) -> bytes:
+        """Take a 96-bit nonce from the pool, refilling it when exhausted"""
+        with self._nonce_lock:
+            pos = self._nonce_pos
+            if pos == len(self._nonce_pool):
+                self._nonce_pool = os.urandom(12 * self.NONCE_POOL_SIZE)
+                pos = 0
+            self._nonce_pos = pos + 12
+            return self._nonce_pool[pos:pos + 12]
 
     def get_key(self) -> AESGCM:
-        """Get current ephemeral AESGCM cipher"""
-        # Check if key expired
-        if datetime.utcnow() - self.key_created_at > timedelta(seconds=self.rotation_interval):
-            logger.warning("Key expired, forcing rotation")
-            self._rotate_key()
+        """
+        Get current ephemeral AEAD cipher (AESGCM or ChaCha20Poly1305)
 
-        return self.current_aesgcm
+        Expiry is enforced by the rotation thread, which swaps in a
+        pre-derived key on schedule.
+        """
+        return self._epoch[0]
 
     def encrypt(self, data: bytes) -> bytes:
         """
-        Encrypt data with current ephemeral key (AES-256-GCM)
+        Encrypt data with current ephemeral key (self.backend AEAD:
+        AES-256-GCM or ChaCha20-Poly1305)
 
         Returns: nonce + ciphertext (nonce is prepended)
         """
-        nonce = secrets.token_bytes(12)  # 96-bit nonce for GCM
-        ciphertext = self.get_key().encrypt(nonce, data, None)
+        nonce = self._next_nonce()  # 96-bit nonce, same size for both AEADs
+        ciphertext = self._epoch[0].encrypt(nonce, data, None)
         # Return nonce + ciphertext
         return nonce + ciphertext
 
     def decrypt(self, encrypted_data: bytes) -> bytes:
         """
-        Decrypt data with current ephemeral key (AES-256-GCM)
+        Decrypt data with current ephemeral key (self.backend AEAD)
 
         Args:
             encrypted_data: nonce + ciphertext
@@ -243,7 +644,34 @@ class EphemeralKeyManager:
         nonce = encrypted_data[:12]
         ciphertext = encrypted_data[12:]
 
-        return self.get_key().decrypt(nonce, ciphertext, None)
+        return self._epoch[0].decrypt(nonce, ciphertext, None)
+
+    def encrypt_batch(self, items: List[bytes]) -> List[bytes]:
+        """
+        Encrypt many messages with one key snapshot (self.backend AEAD)
+
+        The cipher already dispatches to OpenSSL's vectorized code; batching
+        binds the cipher once, so every item uses the same key even across
+        a rotation, and draws all nonces in a single call.
+
+        Returns: list of nonce + ciphertext, same order as items
+        """
+        cipher = self.get_key()
+        nonces = os.urandom(12 * len(items))
+        encrypt = cipher.encrypt
+        result = []
+        for i, data in enumerate(items):
+            nonce = nonces[12 * i:12 * i + 12]
+            result.append(nonce + encrypt(nonce, data, None))
+        return result
+
+    def decrypt_batch(self, items: List[bytes]) -> List[bytes]:
+        """
+        Decrypt many nonce + ciphertext messages with one key snapshot
+        (self.backend AEAD)
+        """
+        decrypt = self.get_key().decrypt
+        return [decrypt(blob[:12], blob[12:], None) for blob in items]
 
     def sign_attestation(self, data: bytes) -> Tuple[str, str]:
         """
@@ -253,15 +681,13 @@ class EphemeralKeyManager:
             (signature_b64, nonce_hex)
         """
         # Generate unique nonce
-        nonce = secrets.token_bytes(16)
+        nonce = os.urandom(16)
 
-        # Create HMAC with SHA-3
-        combined = data + nonce
-        signature = hmac.new(
-            self.current_key,
-            combined,
-            hashlib.sha3_256
-        ).digest()
+        # Create HMAC with SHA-3 over data + nonce
+        mac = self._epoch[2].copy()
+        mac.update(data)
+        mac.update(nonce)
+        signature = mac.digest()
 
         # Return as base64 + hex
         return base64.b64encode(signature).decode('utf-8'), nonce.hex()
@@ -282,12 +708,10 @@ class EphemeralKeyManager:
             nonce = bytes.fromhex(nonce_hex)
             expected_sig = base64.b64decode(signature_b64)
 
-            combined = data + nonce
-            computed_sig = hmac.new(
-                self.current_key,
-                combined,
-                hashlib.sha3_256
-            ).digest()
+            mac = self._epoch[2].copy()
+            mac.update(data)
+            mac.update(nonce)
+            computed_sig = mac.digest()
 
             # Constant-time comparison
             return hmac.compare_digest(expected_sig, computed_sig)
@@ -298,33 +722,86 @@ class EphemeralKeyManager:
 class KillSwitch:
     """Automatic kill-switch for suspicious patterns"""
 
+    EVENT_CAPACITY = 64  # Initial timestamp buffer size (doubles when full)
+    COALESCE_WINDOW = 0.02  # Seconds of events folded into one chain entry
+
+    _instances: 'weakref.WeakSet[KillSwitch]' = weakref.WeakSet()  # Flushed at exit
+
     def __init__(self, threshold: int = 3, window: int = 60):
         self.threshold = threshold  # Max suspicious events before kill
         self.window = window  # Time window in seconds
-        self.events: List[float] = []
+        # Sorted monotonic timestamps; live window is events[head:tail]
+        self.events = np.empty(self.EVENT_CAPACITY, dtype=np.float64)
+        self.head = 0
+        self.tail = 0
         self.armed = True
-        self.logger = MerkleChainLogger()
+        self.logger = MerkleChainLogger.shared()
+
+        # Burst coalescing: events buffered until the timer flushes them
+        self._pending: List[Dict] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()  # Keeps flushed bursts in order
+        KillSwitch._instances.add(self)
+
+    def _flush_pending(self):
+        """Write buffered suspicious events as a single Merkle entry"""
+        with self._flush_lock:
+            # Swap the buffer out; reporters never wait on the disk write
+            with self._pending_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                pending, self._pending = self._pending, []
+
+            if len(pending) == 1:
+                self.logger.append(f"Suspicious: {pending[0]['type']}", pending[0])
+            elif pending:
+                self.logger.append("Suspicious burst", {'events': pending})
+
+    def _push(self, now: float):
+        """Append a timestamp, compacting or doubling the buffer when full"""
+        if self.tail == len(self.events):
+            count = self.tail - self.head
+            if count * 2 > len(self.events):
+                buf = np.empty(len(self.events) * 2, dtype=np.float64)
+            else:
+                buf = self.events
+            buf[:count] = self.events[self.head:self.tail]
+            self.events, self.head, self.tail = buf, 0, count
+        self.events[self.tail] = now
+        self.tail += 1
+
+    @property
+    def event_count(self) -> int:
+        """Suspicious events currently inside the window"""
+        return self.tail - self.head
 
     def report_suspicious_event(self, event_type: str, details: Dict = None):
         """Report suspicious event and check if kill-switch should activate"""
-        now = time.time()
-        self.events.append(now)
-
-        # Remove events outside window
-        self.events = [t for t in self.events if now - t < self.window]
-
-        # Log event
-        self.logger.append(
-            f"Suspicious: {event_type}",
-            {
+        now = time.monotonic()
+        self._push(now)
+
+        # Remove events outside window (buffer is sorted: binary search)
+        self.head += int(np.searchsorted(
+            self.events[self.head:self.tail], now - self.window, side='right'
+        ))
+        count = self.tail - self.head
+
+        # Log event (coalesced with others arriving in the same burst)
+        with self._pending_lock:
+            self._pending.append({
                 'type': event_type,
                 'details': details or {},
-                'count_in_window': len(self.events)
-            }
-        )
+                'count_in_window': count
+            })
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.COALESCE_WINDOW, self._flush_pending)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
         # Check if threshold exceeded
-        if len(self.events) >= self.threshold:
+        if count >= self.threshold:
             self.activate()
             return True
 
@@ -337,16 +814,19 @@ class KillSwitch:
 
         self.armed = False
 
+        # Audit trail must hold the triggering events before the kill entry
+        self._flush_pending()
+
         self.logger.append(
             "KILL-SWITCH ACTIVATED",
             {
-                'reason': f'{len(self.events)} suspicious events in {self.window}s',
+                'reason': f'{self.event_count} suspicious events in {self.window}s',
                 'threshold': self.threshold
             }
         )
 
         logger.critical("🔴 KILL-SWITCH ACTIVATED - Shutting down system")
-        logger.critical(f"Reason: {len(self.events)} suspicious events detected")
+        logger.critical(f"Reason: {self.event_count} suspicious events detected")
 
         # TODO: Implement actual shutdown logic
         # For now, just log. In production, would:
@@ -358,6 +838,20 @@ class KillSwitch:
         raise SystemExit("Kill-switch activated due to suspicious activity")
 
 
+@atexit.register
+def _flush_kill_switches():
+    """Write coalesced events whose timer has not fired yet before exit"""
+    # Registered after _close_chain_loggers, so atexit runs it first
+    for kill_switch in list(KillSwitch._instances):
+        kill_switch._flush_pending()
+
+
+AutoHealStatus = namedtuple(
+    'AutoHealStatus',
+    'status current_key_age chain_integrity chain_length rotation_count merkle_root'
+)
+
+
 class LuaAutoHeal:
     """
     Main Lua-AutoHeal system combining:
@@ -369,7 +863,7 @@ class LuaAutoHeal:
     def __init__(self):
         self.key_manager = EphemeralKeyManager(rotation_interval=300)
         self.kill_switch = KillSwitch(threshold=3, window=60)
-        self.logger = MerkleChainLogger()
+        self.logger = MerkleChainLogger.shared()
 
         self.logger.append("Lua-AutoHeal initialized", {
             'version': '2.0',
@@ -385,6 +879,14 @@ class LuaAutoHeal:
         """Decrypt data with current ephemeral key"""
         return self.key_manager.decrypt(encrypted_data)
 
+    def encrypt_batch(self, items: List[bytes]) -> List[bytes]:
+        """Encrypt many messages with current ephemeral key"""
+        return self.key_manager.encrypt_batch(items)
+
+    def decrypt_batch(self, items: List[bytes]) -> List[bytes]:
+        """Decrypt many messages with current ephemeral key"""
+        return self.key_manager.decrypt_batch(items)
+
     def report_suspicious(self, event_type: str, details: Dict = None):
         """Report suspicious activity"""
         return self.kill_switch.report_suspicious_event(event_type, details)
@@ -420,16 +922,20 @@ class LuaAutoHeal:
         """
         return self.key_manager.verify_attestation(data, signature_b64, nonce_hex)
 
+    def get_status_fast(self) -> AutoHealStatus:
+        """Get system status as an AutoHealStatus tuple (no dict rebuild)"""
+        return AutoHealStatus(
+            'ACTIVE' if self.kill_switch.armed else 'KILLED',
+            (time.monotonic_ns() - self.key_manager.key_created_at_ns) // 1_000_000_000,
+            self.logger.verify_integrity(incremental=True),
+            len(self.logger.chain),
+            self.key_manager.rotation_count,
+            self.logger.current_root
+        )
+
     def get_status(self) -> Dict:
         """Get system status"""
-        return {
-            'status': 'ACTIVE' if self.kill_switch.armed else 'KILLED',
-            'rotation_count': self.key_manager.rotation_count,
-            'current_key_age': (datetime.utcnow() - self.key_manager.key_created_at).seconds,
-            'merkle_root': self.logger.current_root,
-            'chain_length': len(self.logger.chain),
-            'chain_integrity': self.verify_integrity()
-        }
+        return self.get_status_fast()._asdict()
 
 
 # Singleton instance
@@ -16,7 +16,7 @@ Part of Ξ-LUA v2.0 SuperProject
 import time
 import threading
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 import logging
 
 from .lua_autoheal import get_autoheal, LuaAutoHeal
@@ -25,6 +25,15 @@ from ..omniverse.omega_gate import OmegaGate
 
 logger = logging.getLogger(__name__)
 
+# Event types forwarded to AutoHeal as suspicious activity
+_SUSPICIOUS_EVENT_TYPES = frozenset((
+    'failed_auth',
+    'invalid_signature',
+    'rate_limit_exceeded',
+    'unauthorized_access',
+    'tampering_detected'
+))
+
 
 class UnifiedMonitor:
     """
@@ -41,14 +50,18 @@ class UnifiedMonitor:
     - Log all events to Merkle chain
     """
 
-    def __init__(self, monitor_interval: int = 5):
+    def __init__(self, monitor_interval: int = 5, max_interval: int = 60):
         """
         Initialize unified monitor
 
         Args:
             monitor_interval: How often to check system health (seconds)
+            max_interval: Upper bound for the idle backoff (seconds)
         """
         self.monitor_interval = monitor_interval
+        self._max_interval = max(max_interval, monitor_interval)
+        # Current wait: doubles while checks are quiet, resets on any event
+        self._cur_interval = monitor_interval
         self.autoheal = get_autoheal()
         self.stabilizer = get_stabilizer()
 
@@ -58,14 +71,26 @@ class UnifiedMonitor:
             logger.warning(f"Omega-Gate not available: {e}")
             self.omega_gate = None
 
+        # Resolve the Ω reader once instead of reflecting on every tick
+        self._read_omega: Optional[Callable[[], Optional[float]]] = None
+        if self.omega_gate is not None and hasattr(self.omega_gate, 'current_omega'):
+            gate = self.omega_gate
+            self._read_omega = lambda: gate.current_omega
+
         self.running = False
         self.monitor_thread: Optional[threading.Thread] = None
 
+        # Wakes the monitor loop early when events arrive or on stop()
+        self._wake_event = threading.Event()
+        # Cancels in-flight simulate_attack() runs on stop()
+        self._stop_event = threading.Event()
+
         # Statistics
         self.total_events = 0
         self.security_events = 0
         self.recalibrations = 0
-        self.start_time = datetime.utcnow()
+        self._start_mono = time.monotonic()
+        self.start_wall = datetime.utcnow().isoformat()  # display only
 
     def start(self):
         """Start unified monitoring"""
@@ -74,6 +99,7 @@ class UnifiedMonitor:
             return
 
         self.running = True
+        self._stop_event.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
 
@@ -89,6 +115,8 @@ class UnifiedMonitor:
             return
 
         self.running = False
+        self._stop_event.set()
+        self._notify()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2)
 
@@ -97,78 +125,118 @@ class UnifiedMonitor:
             'total_events': self.total_events,
             'security_events': self.security_events,
             'recalibrations': self.recalibrations,
-            'uptime_seconds': (datetime.utcnow() - self.start_time).total_seconds()
+            'uptime_seconds': time.monotonic() - self._start_mono
         })
 
+    def _notify(self):
+        """Wake the monitor loop before its interval elapses"""
+        self._wake_event.set()
+
     def _monitor_loop(self):
-        """Main monitoring loop"""
+        """Main monitoring loop (adaptive interval, woken early by events)"""
+        woken = False
         while self.running:
             try:
-                self._check_system_health()
+                saw_event = self._check_system_health()
             except Exception as e:
                 logger.error(f"Error in monitor loop: {e}")
                 self.autoheal.report_suspicious("monitor_error", {
                     'error': str(e)
                 })
+                saw_event = True
+
+            # Hybrid polling: back off while quiet, snap back on activity
+            if saw_event or woken:
+                self._cur_interval = self.monitor_interval
+            else:
+                self._cur_interval = min(self._max_interval, self._cur_interval * 2)
 
-            time.sleep(self.monitor_interval)
+            # Cleared before the next check, so a set() racing the clear is still seen by it
+            woken = self._wake_event.wait(self._cur_interval)
+            self._wake_event.clear()
+
+    def _check_system_health(self) -> bool:
+        """
+        Check health of all subsystems
+
+        Returns:
+            True if any warning/critical condition was seen
+        """
+        saw_event = False
 
-    def _check_system_health(self):
-        """Check health of all subsystems"""
         # Check AutoHeal status
-        ah_status = self.autoheal.get_status()
+        ah_status = self.autoheal.get_status_fast()
 
-        if ah_status['status'] != 'ACTIVE':
+        if ah_status.status != 'ACTIVE':
             logger.critical("🔴 AutoHeal KILL-SWITCH ACTIVATED!")
             # System should already be shutting down
-            return
+            return True
 
         # Check key age (warn if getting close to rotation)
-        key_age = ah_status['current_key_age']
+        key_age = ah_status.current_key_age
         if key_age > 270:  # 270s = 4.5 minutes (warning before 5min rotation)
-            logger.debug(f"Key rotation imminent ({key_age}s / 300s)")
+            logger.debug("Key rotation imminent (%ss / 300s)", key_age)
+
+        # Read stabilizer fields once up front (SystemState is mutated
+        # in place by update_cvar())
+        stabilizer_state = self.stabilizer.state
+        cvar = stabilizer_state.cvar
+        psi_target = stabilizer_state.psi_target
+        attack_mode = stabilizer_state.attack_mode
+        recalibration_count = stabilizer_state.recalibration_count
+
+        # Fast path: chain intact, CVaR low, no new recalibration, no Ω to check
+        if (ah_status.chain_integrity and cvar <= 0.15
+                and recalibration_count == self.recalibrations
+                and self._read_omega is None):
+            self.total_events += 1
+            return False
 
         # Check Merkle chain integrity
-        if not ah_status['chain_integrity']:
+        if not ah_status.chain_integrity:
             logger.critical("🔴 MERKLE CHAIN INTEGRITY COMPROMISED!")
             self.autoheal.report_suspicious("chain_integrity_failure", {
-                'chain_length': ah_status['chain_length']
+                'chain_length': ah_status.chain_length
             })
             self.security_events += 1
+            saw_event = True
 
         # Check Stabilizer CVaR
-        stabilizer_state = self.stabilizer.state
-
-        if stabilizer_state.cvar > 0.15:
-            logger.warning(f"⚠️  High CVaR: {stabilizer_state.cvar:.4f}")
+        if cvar > 0.15:
+            logger.warning("⚠️  High CVaR: %.4f", cvar)
 
             # Report to AutoHeal
             self.autoheal.report_suspicious("high_cvar", {
-                'cvar': stabilizer_state.cvar,
-                'psi_target': stabilizer_state.psi_target,
-                'attack_mode': stabilizer_state.attack_mode
+                'cvar': cvar,
+                'psi_target': psi_target,
+                'attack_mode': attack_mode
             })
             self.security_events += 1
+            saw_event = True
 
         # Track recalibrations
-        if stabilizer_state.recalibration_count > self.recalibrations:
-            self.recalibrations = stabilizer_state.recalibration_count
-            logger.info(f"📈 System recalibrated (total: {self.recalibrations})")
+        if recalibration_count > self.recalibrations:
+            self.recalibrations = recalibration_count
+            logger.info("📈 System recalibrated (total: %d)", self.recalibrations)
+            saw_event = True
 
         # Check Omega-Gate (if available)
-        if self.omega_gate:
+        if self._read_omega is not None:
             try:
-                omega_value = getattr(self.omega_gate, 'current_omega', None)
+                omega_value = self._read_omega()
                 if omega_value and omega_value < 0.85:
-                    logger.warning(f"⚠️  Low Omega: {omega_value:.4f}")
+                    logger.warning("⚠️  Low Omega: %.4f", omega_value)
                     self.autoheal.report_suspicious("low_omega", {
                         'omega': omega_value
                     })
+                    saw_event = True
             except Exception as e:
-                logger.debug(f"Omega-Gate check failed: {e}")
+                logger.debug("Omega-Gate check failed: %s", e)
 
         self.total_events += 1
 
+        return saw_event
+
     def report_event(self, event_type: str, details: Dict):
         """
         Report custom event to unified monitor
@@ -181,19 +249,12 @@ class UnifiedMonitor:
         self.autoheal.logger.append(f"Event: {event_type}", details)
 
         # Check if suspicious
-        suspicious_types = [
-            'failed_auth',
-            'invalid_signature',
-            'rate_limit_exceeded',
-            'unauthorized_access',
-            'tampering_detected'
-        ]
-
-        if event_type in suspicious_types:
+        if event_type in _SUSPICIOUS_EVENT_TYPES:
             self.autoheal.report_suspicious(event_type, details)
             self.security_events += 1
 
         self.total_events += 1
+        self._notify()
 
     def simulate_attack(self, duration: int = 10, cvar: float = 0.25):
         """
@@ -205,10 +266,12 @@ class UnifiedMonitor:
         """
         logger.warning(f"🔴 SIMULATING ATTACK (CVaR={cvar:.2f}, duration={duration}s)")
 
-        start = time.time()
+        start = time.monotonic()
+        end = start + duration
+        deadline = start
         iteration = 0
 
-        while time.time() - start < duration:
+        while time.monotonic() < end:
             # Update CVaR (may trigger recalibration)
             self.stabilizer.update_cvar(cvar)
 
@@ -216,11 +279,16 @@ class UnifiedMonitor:
             self.autoheal.report_suspicious("simulated_attack", {
                 'iteration': iteration,
                 'cvar': cvar,
-                'elapsed': time.time() - start
+                'elapsed': time.monotonic() - start
             })
+            self._notify()
 
             iteration += 1
-            time.sleep(0.5)
+
+            # Fixed 0.5s cadence (no drift), cut short by stop()
+            deadline += 0.5
+            if self._stop_event.wait(max(0.0, deadline - time.monotonic())):
+                break
 
         logger.info(f"✅ Attack simulation complete ({iteration} iterations)")
 
@@ -229,7 +297,7 @@ class UnifiedMonitor:
         ah_status = self.autoheal.get_status()
         stab_state = self.stabilizer.state
 
-        uptime = (datetime.utcnow() - self.start_time).total_seconds()
+        uptime = time.monotonic() - self._start_mono
 
         return {
             'monitor': {
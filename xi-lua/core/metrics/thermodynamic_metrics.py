@@ -23,14 +23,72 @@ Part of Ξ-LUA v2.0 SuperProject
 
 import math
 import numpy as np
-from typing import Dict, List
-from dataclasses import dataclass
+from typing import Dict, Optional
+from dataclasses import dataclass, fields
 from datetime import datetime
 
+from .._compat import FrozenSlotsPickleMixin, njit
 
-@dataclass
-class ThermodynamicState:
+
+# Tabela IV as rendered by ThermodynamicMetrics.generate_latex_table
+# (LaTeX braces are doubled for str.format_map)
+_LATEX_TEMPLATE = r"""
+\begin{{table}}[h]
+\centering
+\caption{{Métricas Termodinâmicas do Sistema Ξ-LUA}}
+\label{{tab:thermodynamic_metrics}}
+\begin{{tabular}}{{lcc}}
+\hline
+\textbf{{Métrica}} & \textbf{{Símbolo}} & \textbf{{Valor}} \\
+\hline
+Information Coherence & $\Psi$ & {psi:.6f} \\
+Entropy of Coherence & $S_\Psi$ & {s_psi:.6e} \, \text{{J/K}} \\
+Reversal Probability & $P_{{\text{{rev}}}}$ & {prob_reversal:.6e} \\
+Quantum Info Resilience & $I_{{\text{{QIR}}}}$ & {i_qir:.6e} \, \text{{K·s}} \\
+Antifragility Coefficient & $\Lambda_{{\text{{AF}}}}$ & {lambda_af:.6f} \\
+Phase Transition Indicator & $\Phi_{{\text{{jump}}}}$ & {phi_jump:.6f} \, \text{{s}}^{{-1}} \\
+Informational Entropy & $S_{{\text{{info}}}}$ & {s_info:.6e} \, \text{{J/K}} \\
+\hline
+\end{{tabular}}
+\end{{table}}
+        """
+
+
+# No cache=True: numba's on-disk cache pickles the importing module name,
+# so entries written via `core.metrics...` break running this file directly
+@njit
+def _core_kernel(omega, cvar, cumulative_energy, blocks_passed, difficulty_factor, k_b, hbar_over_kb):
+    """
+    Scalar Ψ, S_Ψ, Prob(Reversão) and I_QIR in one call
+
+    Same formulas and edge cases as the compute_* methods.
+
+    Returns:
+        (psi, s_psi, prob_reversal, i_qir)
+    """
+    psi = max(0.0, min(1.0, omega * (1.0 - cvar)))
+
+    if 0.0 < psi < 1.0:
+        h = -(psi * math.log(psi) + (1.0 - psi) * math.log1p(-psi))
+    else:
+        h = 0.0
+    s_psi = k_b * h
+    i_qir = hbar_over_kb * psi / h if h > 0.0 else 0.0
+
+    if cumulative_energy <= 0.0 or blocks_passed == 0:
+        prob_reversal = 1.0
+    else:
+        exponent = -cumulative_energy / (k_b * difficulty_factor * blocks_passed)
+        prob_reversal = math.exp(max(-100.0, min(0.0, exponent)))
+
+    return psi, s_psi, prob_reversal, i_qir
+
+
+@dataclass(frozen=True)
+class ThermodynamicState(FrozenSlotsPickleMixin):
     """Complete thermodynamic state of Ξ-LUA"""
+    __slots__ = ('psi', 's_psi', 'prob_reversal', 'i_qir', 'lambda_af', 'phi_jump', 's_info')
+
     psi: float  # Information coherence
     s_psi: float  # Entropy of coherence
     prob_reversal: float  # Reversal probability
@@ -51,6 +109,84 @@ class ThermodynamicState:
         }
 
 
+class _History:
+    """
+    Struct-of-Arrays ring buffer for ThermodynamicState samples.
+
+    One contiguous float64 column per metric, grown by doubling up to
+    `capacity`; after that the oldest samples are overwritten.
+    """
+
+    INITIAL_CAPACITY = 1024
+    FIELDS = tuple(f.name for f in fields(ThermodynamicState))
+
+    def __init__(self, capacity: int = 16384):
+        self.capacity = capacity
+        self._allocated = min(self.INITIAL_CAPACITY, capacity)
+        self._columns = {name: np.empty(self._allocated) for name in self.FIELDS}
+        self.n = 0  # Total samples ever recorded
+
+    def __len__(self) -> int:
+        return min(self.n, self.capacity)
+
+    @property
+    def _start(self) -> int:
+        """Slot holding the oldest retained sample"""
+        return self.n % self.capacity if self.n > self.capacity else 0
+
+    def __getitem__(self, index: int) -> ThermodynamicState:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("history index out of range")
+
+        slot = (self._start + index) % self.capacity
+        return ThermodynamicState(**{
+            name: float(self._columns[name][slot]) for name in self.FIELDS
+        })
+
+    def _reserve(self, extra: int):
+        needed = min(self.n + extra, self.capacity)
+        if needed <= self._allocated:
+            return
+
+        while self._allocated < needed:
+            self._allocated = min(self._allocated * 2, self.capacity)
+
+        for name, column in self._columns.items():
+            grown = np.empty(self._allocated)
+            grown[:self.n] = column[:self.n]
+            self._columns[name] = grown
+
+    def append(self, state: ThermodynamicState):
+        self._reserve(1)
+        slot = self.n % self.capacity
+        for name in self.FIELDS:
+            self._columns[name][slot] = getattr(state, name)
+        self.n += 1
+
+    def extend(self, columns: Dict[str, np.ndarray]):
+        count = len(columns[self.FIELDS[0]])
+        keep = min(count, self.capacity)  # Older samples would be overwritten anyway
+        self._reserve(count)
+
+        slots = (self.n + count - keep + np.arange(keep)) % self.capacity
+        for name in self.FIELDS:
+            self._columns[name][slots] = columns[name][count - keep:]
+        self.n += count
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only array of one metric over retained samples, oldest first"""
+        column = self._columns[name]
+        if self.n <= self.capacity:
+            view = column[:self.n]
+        else:
+            view = np.concatenate((column[self._start:], column[:self._start]))
+        view.flags.writeable = False
+        return view
+
+
 class ThermodynamicMetrics:
     """
     Compute the 7 thermodynamically consistent metrics
@@ -60,9 +196,13 @@ class ThermodynamicMetrics:
     # Physical constants (for dimensional consistency)
     K_BOLTZMANN = 1.380649e-23  # J/K (for entropy calculations)
     HBAR = 1.054571817e-34  # J·s (for quantum information)
+    HBAR_OVER_KB = HBAR / K_BOLTZMANN  # I_QIR = (ℏ/k_B) · Ψ / H(Ψ)
+
+    # Ω components feeding S_info, with defaults for missing keys
+    OMEGA_COMPONENTS = (('CVaR', 0.0), ('β', 0.0), ('ERR_5m', 0.0), ('Idem', 1.0))
 
-    def __init__(self):
-        self.history: List[ThermodynamicState] = []
+    def __init__(self, history_capacity: int = 16384):
+        self.history = _History(history_capacity)
 
     def compute_psi(self, omega: float, cvar: float) -> float:
         """
@@ -89,15 +229,15 @@ class ThermodynamicMetrics:
 
         Units: J/K (thermodynamic entropy)
         """
-        if psi <= 0 or psi >= 1:
-            return 0.0
+        return self.K_BOLTZMANN * self._binary_entropy(psi)
 
-        s_psi = -self.K_BOLTZMANN * (
-                psi * math.log(psi) +
-                (1 - psi) * math.log(1 - psi)
-        )
+    @staticmethod
+    def _binary_entropy(psi: float) -> float:
+        """H(Ψ) = -[Ψ·ln(Ψ) + (1-Ψ)·ln(1-Ψ)] in nats, 0 outside (0, 1)"""
+        if not 0 < psi < 1:
+            return 0.0
 
-        return s_psi
+        return -(psi * math.log(psi) + (1 - psi) * math.log1p(-psi))
 
     def compute_prob_reversal(
             self,
@@ -211,27 +351,28 @@ class ThermodynamicMetrics:
 
         Units: J/K
         """
-        # Extract components
-        components = [
-            omega_components.get('CVaR', 0.0),
-            omega_components.get('β', 0.0),
-            omega_components.get('ERR_5m', 0.0),
-            omega_components.get('Idem', 1.0)
-        ]
+        components = self._omega_component_row(omega_components)
 
-        # Normalize to probabilities
-        total = sum(components) + 1e-10  # Avoid division by zero
-        probs = [c / total for c in components]
+        return float(self._s_info_rows(components[np.newaxis, :])[0])
+
+    def _omega_component_row(self, omega_components: Dict) -> np.ndarray:
+        """Ω components dict -> float64 row in OMEGA_COMPONENTS order"""
+        return np.fromiter(
+            (omega_components.get(key, default) for key, default in self.OMEGA_COMPONENTS),
+            dtype=np.float64,
+            count=len(self.OMEGA_COMPONENTS)
+        )
 
-        # Shannon entropy
-        entropy = 0.0
-        for p in probs:
-            if p > 0:
-                entropy -= p * math.log(p)
+    def _s_info_rows(self, components: np.ndarray) -> np.ndarray:
+        """S_info for each row of an (N, 4) component matrix"""
+        # Normalize to probabilities
+        probs = components / (components.sum(axis=1, keepdims=True) + 1e-10)  # Avoid division by zero
 
-        s_info = self.K_BOLTZMANN * entropy
+        # Shannon entropy (p = 0 terms contribute 0)
+        log_p = np.log(probs, out=np.zeros_like(probs), where=probs > 0)
+        entropy = -np.einsum('ij,ij->i', probs, log_p)
 
-        return s_info
+        return self.K_BOLTZMANN * entropy
 
     def compute_full_state(
             self,
@@ -262,27 +403,22 @@ class ThermodynamicMetrics:
         Returns:
             ThermodynamicState with all 7 metrics
         """
-        # 1. Ψ
-        psi = self.compute_psi(omega, cvar)
-
-        # 2. S_Ψ
-        s_psi = self.compute_s_psi(psi)
-
-        # 3. Prob(Reversão)
-        prob_reversal = self.compute_prob_reversal(cumulative_energy, blocks_passed)
-
-        # 4. I_QIR
-        i_qir = self.compute_i_qir(psi, s_psi)
+        # 1-4. Ψ, S_Ψ, Prob(Reversão), I_QIR
+        psi, s_psi, prob_reversal, i_qir = _core_kernel(
+            float(omega), float(cvar), float(cumulative_energy), float(blocks_passed),
+            100.0, self.K_BOLTZMANN, self.HBAR_OVER_KB
+        )
 
-        # 5. Λ_AF
-        if psi_before_attack is not None and psi_after_attack is not None:
-            lambda_af = self.compute_lambda_af(psi_before_attack, psi_after_attack, attack_strength)
+        # 5. Λ_AF (inlined compute_lambda_af)
+        if (psi_before_attack is not None and psi_after_attack is not None
+                and psi_before_attack > 0 and attack_strength > 0):
+            lambda_af = (psi_after_attack - psi_before_attack) / psi_before_attack / attack_strength
         else:
             lambda_af = 0.0
 
-        # 6. Φ_jump
-        if psi_prev is not None:
-            phi_jump = self.compute_phi_jump(psi, psi_prev)
+        # 6. Φ_jump (inlined compute_phi_jump, dt = 1)
+        if psi_prev is not None and psi > 0:
+            phi_jump = abs(psi - psi_prev) / psi
         else:
             phi_jump = 0.0
 
@@ -307,29 +443,105 @@ class ThermodynamicMetrics:
 
         return state
 
+    def compute_full_state_batch(
+            self,
+            omega: np.ndarray,
+            cvar: np.ndarray,
+            cumulative_energy: np.ndarray,
+            blocks_passed: np.ndarray,
+            psi_before_attack: Optional[np.ndarray] = None,
+            psi_after_attack: Optional[np.ndarray] = None,
+            attack_strength: np.ndarray = 0.0,
+            psi_prev: Optional[np.ndarray] = None,
+            omega_components: Optional[np.ndarray] = None,
+            difficulty_factor: float = 100.0
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute all 7 metrics for N samples as vectorized NumPy ops.
+
+        Same formulas and edge cases as the scalar compute_* methods.
+        Every argument is a length-N array (scalars broadcast);
+        omega_components is an (N, 4) matrix in OMEGA_COMPONENTS order.
+        All N samples are appended to history.
+
+        Returns:
+            Dict of ThermodynamicState field name -> length-N float64 array
+        """
+        omega = np.asarray(omega, dtype=np.float64)
+        cvar = np.asarray(cvar, dtype=np.float64)
+        cumulative_energy = np.asarray(cumulative_energy, dtype=np.float64)
+        blocks_passed = np.asarray(blocks_passed, dtype=np.float64)
+        attack_strength = np.asarray(attack_strength, dtype=np.float64)
+        shape = np.broadcast(omega, cvar, cumulative_energy, blocks_passed).shape
+        zeros = np.zeros(shape)
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # 1. Ψ
+            psi = np.clip(omega * (1.0 - cvar), 0.0, 1.0)
+
+            # 2. S_Ψ = k_B · H(Ψ), H computed once and shared with I_QIR
+            h = np.where(
+                (psi > 0) & (psi < 1),
+                -(psi * np.log(psi) + (1 - psi) * np.log1p(-psi)),
+                0.0
+            )
+            s_psi = self.K_BOLTZMANN * h
+
+            # 3. Prob(Reversão)
+            t_eff = difficulty_factor * blocks_passed
+            exponent = np.clip(-cumulative_energy / (self.K_BOLTZMANN * t_eff), -100, 0)
+            prob_reversal = np.where(
+                (cumulative_energy <= 0) | (blocks_passed == 0),
+                1.0,
+                np.exp(exponent)
+            )
+
+            # 4. I_QIR = ℏ·Ψ / (k_B·H) with the k_B division folded into HBAR_OVER_KB
+            i_qir = np.where(h > 0, self.HBAR_OVER_KB * psi / h, 0.0)
+
+            # 5. Λ_AF
+            if psi_before_attack is not None and psi_after_attack is not None:
+                before = np.asarray(psi_before_attack, dtype=np.float64)
+                after = np.asarray(psi_after_attack, dtype=np.float64)
+                lambda_af = np.where(
+                    (before <= 0) | (attack_strength <= 0),
+                    0.0,
+                    (after - before) / before / attack_strength
+                )
+            else:
+                lambda_af = zeros
+
+            # 6. Φ_jump (dt = 1)
+            if psi_prev is not None:
+                phi_jump = np.where(psi > 0, np.abs(psi - psi_prev) / psi, 0.0)
+            else:
+                phi_jump = zeros
+
+        # 7. S_info
+        if omega_components is not None:
+            s_info = self._s_info_rows(np.asarray(omega_components, dtype=np.float64))
+        else:
+            s_info = zeros
+
+        batch = {
+            'psi': psi,
+            's_psi': s_psi,
+            'prob_reversal': prob_reversal,
+            'i_qir': i_qir,
+            'lambda_af': lambda_af,
+            'phi_jump': phi_jump,
+            's_info': s_info
+        }
+        batch = {name: np.array(np.broadcast_to(values, shape)) for name, values in batch.items()}
+
+        # Record in history
+        self.history.extend(batch)
+
+        return batch
+
     def generate_latex_table(self, state: ThermodynamicState) -> str:
         """Generate LaTeX table (Tabela IV) for paper"""
-        latex = r"""
-\begin{table}[h]
-\centering
-\caption{Métricas Termodinâmicas do Sistema Ξ-LUA}
-\label{tab:thermodynamic_metrics}
-\begin{tabular}{lcc}
-\hline
-\textbf{Métrica} & \textbf{Símbolo} & \textbf{Valor} \\
-\hline
-Information Coherence & $\Psi$ & """ + f"{state.psi:.6f}" + r""" \\
-Entropy of Coherence & $S_\Psi$ & """ + f"{state.s_psi:.6e}" + r""" \, \text{J/K} \\
-Reversal Probability & $P_{\text{rev}}$ & """ + f"{state.prob_reversal:.6e}" + r""" \\
-Quantum Info Resilience & $I_{\text{QIR}}$ & """ + f"{state.i_qir:.6e}" + r""" \, \text{K·s} \\
-Antifragility Coefficient & $\Lambda_{\text{AF}}$ & """ + f"{state.lambda_af:.6f}" + r""" \\
-Phase Transition Indicator & $\Phi_{\text{jump}}$ & """ + f"{state.phi_jump:.6f}" + r""" \, \text{s}^{-1} \\
-Informational Entropy & $S_{\text{info}}$ & """ + f"{state.s_info:.6e}" + r""" \, \text{J/K} \\
-\hline
-\end{tabular}
-\end{table}
-        """
-        return latex
+        return _LATEX_TEMPLATE.format_map({name: getattr(state, name) for name in state.__slots__})
 
 
 if __name__ == '__main__':
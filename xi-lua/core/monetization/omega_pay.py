@@ -20,12 +20,19 @@ Part of Ξ-LUA v2.0 SuperProject
 
 import os
 import json
+import time
+import struct
 import hashlib
-from typing import Dict, Optional, Tuple
+import numpy as np
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
+from .._compat import FrozenSlotsPickleMixin
+
 
 class AuditTier(Enum):
     """Audit pricing tiers"""
@@ -48,6 +55,23 @@ class PricingConfig:
     currency: str = "BRL"  # Brazilian Real
 
 
+# PaymentRecord.status -> code in OmegaPay._statuses
+PAYMENT_STATUS_CODES = {'pending': 0, 'confirmed': 1, 'failed': 2}
+
+
+@dataclass(frozen=True)
+class PaymentRecord(FrozenSlotsPickleMixin):
+    """Confirmed payment as kept in OmegaPay.payments"""
+    __slots__ = ('payment_id', 'transaction_hash', 'payment_method', 'amount', 'confirmed_at', 'status')
+
+    payment_id: str
+    transaction_hash: str
+    payment_method: str
+    amount: float
+    confirmed_at: str
+    status: str
+
+
 class OmegaPay:
     """
     Ω-Pay Monetization System
@@ -60,6 +84,10 @@ class OmegaPay:
     - Evidence-Note NFT for full audits
     """
 
+    # Unconfirmed intents remembered for confirm_payment; the oldest are
+    # dropped beyond this (their confirmation falls back to the estimate)
+    MAX_PENDING_INTENTS = 10_000
+
     def __init__(self, omega_gate, stabilizer, is_mainnet: bool = False):
         """
         Args:
@@ -72,24 +100,35 @@ class OmegaPay:
         self.is_mainnet = is_mainnet
         self.pricing = PricingConfig()
 
+        self._currency = self.pricing.currency
+
+        # Tier -> base price for this network, resolved once
+        if is_mainnet:
+            self._base_prices = {
+                AuditTier.QUICK: self.pricing.quick_mainnet,
+                AuditTier.FULL: self.pricing.full_mainnet
+            }
+        else:
+            self._base_prices = {
+                AuditTier.QUICK: self.pricing.quick_testnet,
+                AuditTier.FULL: self.pricing.full_testnet
+            }
+
         # Payment history
-        self.payments: list[Dict] = []
+        self.payments: List[PaymentRecord] = []
+        self._statuses = array('B')  # Status code per entry of self.payments
 
-        # Revenue tracking
+        # Amounts of intents awaiting confirmation (payment_id -> amount),
+        # oldest first, bounded by MAX_PENDING_INTENTS
+        self._pending_amounts: 'OrderedDict[str, float]' = OrderedDict()
+
+        # Revenue tracking (running, updated in confirm_payment)
         self.total_revenue = 0.0
+        self._confirmed_count = 0
 
     def get_base_price(self, tier: AuditTier) -> float:
         """Get base price for tier (before Stabilizer multiplier)"""
-        if self.is_mainnet:
-            if tier == AuditTier.QUICK:
-                return self.pricing.quick_mainnet
-            else:
-                return self.pricing.full_mainnet
-        else:
-            if tier == AuditTier.QUICK:
-                return self.pricing.quick_testnet
-            else:
-                return self.pricing.full_testnet
+        return self._base_prices[tier]
 
     def get_current_price(self, tier: AuditTier) -> float:
         """
@@ -146,32 +185,52 @@ class OmegaPay:
                 'omega': omega
             }
 
-        # Get current price (includes Stabilizer adjustment)
-        price = self.get_current_price(tier)
+        # Get current price (includes Stabilizer adjustment). Read the
+        # multiplier once so amount, base and multiplier agree even if
+        # the Stabilizer recalibrates concurrently.
+        price_multiplier = self.stabilizer.state.price_multiplier
+        base_price = self.get_base_price(tier)
+        price = base_price * price_multiplier
 
-        # Create payment intent
-        payment_id = hashlib.sha256(
-            f"{customer_email}{file_hash}{datetime.utcnow().isoformat()}".encode()
-        ).hexdigest()[:16]
+        # Create payment intent (BLAKE2b-64: same 16 hex chars as the old truncated SHA-256)
+        h = hashlib.blake2b(digest_size=8)
+        h.update(customer_email.encode())
+        h.update(file_hash.encode() if isinstance(file_hash, str) else file_hash)
+        created_ns = time.time_ns()
+        h.update(struct.pack('<q', created_ns))
+        payment_id = h.hexdigest()
 
         payment_intent = {
             'success': True,
             'payment_id': payment_id,
             'tier': tier.value,
             'amount': price,
-            'currency': self.pricing.currency,
+            'currency': self._currency,
             'customer_email': customer_email,
             'file_hash': file_hash,
             'omega_score': omega,
-            'price_multiplier': self.stabilizer.state.price_multiplier,
-            'base_price': self.get_base_price(tier),
-            'created_at': datetime.utcnow().isoformat(),
+            'price_multiplier': price_multiplier,
+            'base_price': base_price,
+            'created_at': self._format_ts(created_ns),
             'metadata': metadata or {},
             'status': 'pending'
         }
 
+        pending = self._pending_amounts
+        pending[payment_id] = price
+        if len(pending) > self.MAX_PENDING_INTENTS:
+            pending.popitem(last=False)  # abandoned intent
+
         return payment_intent
 
+    @staticmethod
+    def _format_ts(ns: int) -> str:
+        """time.time_ns() -> naive UTC ISO string (same shape as utcnow().isoformat())"""
+        seconds, nanos = divmod(ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, timezone.utc).replace(
+            tzinfo=None, microsecond=nanos // 1000
+        ).isoformat()
+
     def confirm_payment(
             self,
             payment_id: str,
@@ -190,18 +249,24 @@ class OmegaPay:
             Confirmation data
         """
         # Find payment intent
-        # (In production, would query database)
+        # (In production, would query database; unknown IDs are
+        # estimated at the quick mainnet price)
+        amount = self._pending_amounts.pop(payment_id, self.pricing.quick_mainnet)
 
         # Record payment
-        payment_record = {
-            'payment_id': payment_id,
-            'transaction_hash': transaction_hash,
-            'payment_method': payment_method,
-            'confirmed_at': datetime.utcnow().isoformat(),
-            'status': 'confirmed'
-        }
-
+        payment_record = PaymentRecord(
+            payment_id=payment_id,
+            transaction_hash=transaction_hash,
+            payment_method=payment_method,
+            amount=amount,
+            confirmed_at=self._format_ts(time.time_ns()),
+            status='confirmed'
+        )
+
+        self._confirmed_count += 1
+        self.total_revenue += amount
         self.payments.append(payment_record)
+        self._statuses.append(PAYMENT_STATUS_CODES['confirmed'])
 
         return {
             'success': True,
@@ -210,19 +275,18 @@ class OmegaPay:
             'transaction_hash': transaction_hash
         }
 
+    def count_payments(self, status: str) -> int:
+        """Count recorded payments with the given status (vectorized mask over status codes)"""
+        codes = np.frombuffer(self._statuses, dtype=np.uint8)
+        return int(np.count_nonzero(codes == PAYMENT_STATUS_CODES[status]))
+
     def get_revenue_stats(self) -> Dict:
         """Get revenue statistics"""
-        total_payments = len(self.payments)
-        confirmed_payments = len([p for p in self.payments if p['status'] == 'confirmed'])
-
-        # Would calculate from actual payment amounts in production
-        estimated_revenue = confirmed_payments * self.pricing.quick_mainnet
-
         return {
-            'total_payments': total_payments,
-            'confirmed_payments': confirmed_payments,
-            'estimated_revenue': estimated_revenue,
-            'currency': self.pricing.currency,
+            'total_payments': len(self.payments),
+            'confirmed_payments': self._confirmed_count,
+            'estimated_revenue': self.total_revenue,
+            'currency': self._currency,
             'current_prices': {
                 'quick': self.get_current_price(AuditTier.QUICK),
                 'full': self.get_current_price(AuditTier.FULL)
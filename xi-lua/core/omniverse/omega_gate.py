@@ -21,20 +21,56 @@ Gate Requirement:
 Part of Ξ-LUA v2.0 SuperProject
 """
 
+import time
 import numpy as np
-from typing import List, Dict, Tuple
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-import json
+import orjson
 import logging
 
+from .._compat import FrozenSlotsPickleMixin, njit
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class OmegaComponents:
+@njit
+def _cvar_kernel(scores, alpha):
+    """Mean of the worst α fraction of losses (1 - score); 0 for no scores"""
+    n = scores.size
+    if n == 0:
+        return 0.0
+
+    # Take worst α% (e.g., worst 5%) - partial sort, O(n)
+    cutoff = max(1, int(n * alpha))
+    losses = 1.0 - scores
+    return np.partition(losses, n - cutoff)[n - cutoff:].mean()
+
+
+@njit
+def _omega_kernel(scores, alpha, beta, err_5m, idem, w_cvar, w_beta, w_err, w_idem):
+    """
+    CVaR tail and THE FORMULA in one call
+
+    Returns:
+        (cvar, omega)
+    """
+    cvar = _cvar_kernel(scores, alpha)
+    omega = (
+            w_cvar * (1 - cvar) +
+            w_beta * (1 - beta) +
+            w_err * (1 - err_5m) +
+            w_idem * idem
+    )
+    return cvar, omega
+
+
+@dataclass(frozen=True)
+class OmegaComponents(FrozenSlotsPickleMixin):
     """Individual components of Ω score"""
+    __slots__ = ('cvar', 'beta', 'err_5m', 'idem', 'omega')
+
     cvar: float  # Conditional Value at Risk
     beta: float  # False negative rate
     err_5m: float  # Error rate (5 min)
@@ -50,6 +86,16 @@ class OmegaComponents:
             'Ω': round(self.omega, 4)
         }
 
+    def to_json(self) -> bytes:
+        """Serialize at full precision with orjson (formatting left to the consumer)"""
+        return orjson.dumps({
+            'CVaR_α': self.cvar,
+            'β': self.beta,
+            'ERR_5m': self.err_5m,
+            'Idem': self.idem,
+            'Ω': self.omega
+        })
+
 
 class OmegaGate:
     """
@@ -75,14 +121,70 @@ class OmegaGate:
     ALPHA = 0.05  # 5% worst-case tail
     WINDOW_SIZE = 100  # Rolling window of last 100 actions
 
+    # ERR_5m lookback (seconds)
+    ERR_WINDOW = 300.0
+
+    # Max age of a cached Ω when nothing was recorded (ERR_5m still ages)
+    CACHE_TTL = 0.1
+
+    # check_gate hysteresis: a pass with Ω above HOT_OMEGA is reused for
+    # HOT_TTL seconds unless an error is recorded in between
+    HOT_OMEGA = 0.95
+    HOT_TTL = 0.1
+
+    # Status report layout, filled by get_status_report
+    _REPORT_TEMPLATE = """
+╔══════════════════════════════════════════════════════════╗
+║          Ω-OMNIVERSE Confidence Score Report            ║
+╚══════════════════════════════════════════════════════════╝
+
+Formula: Ω = 0.4·(1−CVaRα) + 0.3·(1−β) + 0.2·(1−ERR₅m) + 0.1·Idem
+
+Components:
+  CVaRα (tail risk):        {cvar:.4f} → contrib: {cvar_contrib:.4f}
+  β (false negative):       {beta:.4f} → contrib: {beta_contrib:.4f}
+  ERR₅m (error rate):       {err_5m:.4f} → contrib: {err_contrib:.4f}
+  Idem (idempotency):       {idem:.4f} → contrib: {idem_contrib:.4f}
+
+Final Score:
+  Ω = {omega:.4f}
+
+Gate Status:
+  Threshold: {threshold:.2f}
+  Status: {status}
+
+System State:
+  Actions tracked: {actions}
+  Recent errors (5m): {errors}
+  Total webhooks: {webhooks}
+  Idempotent: {idempotent}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+The Ξ-LUA {permission} to exist in the next second.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        """
+
     def __init__(self):
-        self.action_history: List[Dict] = []
-        self.error_timestamps: List[datetime] = []
-        self.validation_results: List[bool] = []  # True=valid, False=invalid
+        # Last WINDOW_SIZE actions as parallel ring columns (slot = n % WINDOW_SIZE)
+        self._ts = np.empty(self.WINDOW_SIZE, dtype=np.float64)  # monotonic timestamps
+        self._conf = np.empty(self.WINDOW_SIZE, dtype=np.float64)  # confidence scores
+        self._actions_total = 0  # Actions ever recorded
+        self._action_info: Dict[int, Tuple[str, Optional[Dict]]] = {}  # slot → (type, metadata); audit only
+        self.error_timestamps: Deque[float] = deque()  # Pruned to ERR_WINDOW on insert
+        self.validation_results: Deque[bool] = deque(maxlen=self.WINDOW_SIZE)  # True=valid, False=invalid
+        self.validation_failures = 0  # Running count of False in validation_results
         self.idempotent_count = 0
         self.total_webhooks = 0
 
-    def _compute_cvar(self, confidence_scores: List[float], alpha: float = None) -> float:
+        # Bumped by every record_*; compute_omega reuses its result while unchanged
+        self._dirty = 0
+        self._cached: Optional[Tuple[int, float, OmegaComponents]] = None  # (dirty, computed_at, components)
+
+        # Bumped by record_error; a hot gate pass is only reused within one epoch
+        self._error_epoch = 0
+        self._hot_pass: Optional[Tuple[int, float, OmegaComponents]] = None  # (error_epoch, checked_at, components)
+
+    def _compute_cvar(self, confidence_scores: Sequence[float], alpha: float = None) -> float:
         """
         Compute Conditional Value at Risk (CVaR)
 
@@ -90,25 +192,9 @@ class OmegaGate:
 
         Returns: CVaR value (0 = perfect, 1 = catastrophic)
         """
-        if not confidence_scores:
-            return 0.0
-
         alpha = alpha or self.ALPHA
 
-        # Convert to loss (1 - confidence)
-        losses = [1.0 - score for score in confidence_scores]
-
-        # Sort losses descending
-        sorted_losses = sorted(losses, reverse=True)
-
-        # Take worst α% (e.g., worst 5%)
-        cutoff = max(1, int(len(sorted_losses) * alpha))
-        tail_losses = sorted_losses[:cutoff]
-
-        # CVaR = average of tail losses
-        cvar = np.mean(tail_losses)
-
-        return float(cvar)
+        return float(_cvar_kernel(np.asarray(confidence_scores, dtype=np.float64), alpha))
 
     def _compute_beta(self) -> float:
         """
@@ -123,10 +209,7 @@ class OmegaGate:
 
         # False negative = validation passed but should have failed
         # For now, we approximate β from validation failure rate
-        failures = sum(1 for valid in self.validation_results if not valid)
-        total = len(self.validation_results)
-
-        return failures / total if total > 0 else 0.0
+        return self.validation_failures / len(self.validation_results)
 
     def _compute_err_5m(self) -> float:
         """
@@ -134,21 +217,66 @@ class OmegaGate:
 
         ERR_5m = (errors in last 5 min) / (total actions in last 5 min)
         """
-        now = datetime.utcnow()
-        five_min_ago = now - timedelta(minutes=5)
+        five_min_ago = time.monotonic() - self.ERR_WINDOW
 
         # Count errors in last 5 minutes
-        recent_errors = sum(1 for ts in self.error_timestamps if ts >= five_min_ago)
+        recent_errors = self._count_since(reversed(self.error_timestamps), five_min_ago)
 
         # Count total actions in last 5 minutes
-        recent_actions = sum(1 for action in self.action_history
-                             if datetime.fromisoformat(action['timestamp']) >= five_min_ago)
+        recent_actions = self._count_actions_since(five_min_ago)
 
         if recent_actions == 0:
             return 0.0
 
         return recent_errors / recent_actions
 
+    @property
+    def action_count(self) -> int:
+        """Actions currently in the window"""
+        return min(self._actions_total, self.WINDOW_SIZE)
+
+    def recent_actions(self) -> List[Dict]:
+        """Actions in the window, oldest first (timestamp is time.monotonic())"""
+        count = self.action_count
+        first = self._actions_total - count
+        actions = []
+        for n in range(first, self._actions_total):
+            slot = n % self.WINDOW_SIZE
+            action_type, metadata = self._action_info.get(slot, (None, None))
+            actions.append({
+                'timestamp': float(self._ts[slot]),
+                'type': action_type,
+                'confidence': float(self._conf[slot]),
+                'metadata': metadata
+            })
+        return actions
+
+    def _count_actions_since(self, cutoff: float) -> int:
+        """
+        Count window actions with timestamp >= cutoff
+
+        The ring holds two time-sorted runs, [oldest..end) and [0..oldest),
+        so each is binary searched.
+        """
+        count = self.action_count
+        if count < self.WINDOW_SIZE:
+            runs = (self._ts[:count],)
+        else:
+            oldest = self._actions_total % self.WINDOW_SIZE
+            runs = (self._ts[oldest:], self._ts[:oldest])
+
+        return sum(run.size - int(np.searchsorted(run, cutoff, side='left')) for run in runs)
+
+    @staticmethod
+    def _count_since(newest_first: Iterable[float], cutoff: float) -> int:
+        """Count timestamps >= cutoff, stopping at the first older one"""
+        count = 0
+        for ts in newest_first:
+            if ts < cutoff:
+                break
+            count += 1
+        return count
+
     def _compute_idem(self) -> float:
         """
         Compute idempotency fraction
@@ -170,34 +298,35 @@ class OmegaGate:
 
         Returns: OmegaComponents with all values
         """
+        now = time.monotonic()
+        cached = self._cached
+        if cached is not None and cached[0] == self._dirty and now - cached[1] < self.CACHE_TTL:
+            return cached[2]
+
         # Get recent confidence scores for CVaR
-        recent_scores = [
-            action.get('confidence', 1.0)
-            for action in self.action_history[-self.WINDOW_SIZE:]
-        ]
+        recent_scores = self._conf[:self.action_count]  # Order is irrelevant to CVaR
 
         # Compute components
-        cvar = self._compute_cvar(recent_scores)
         beta = self._compute_beta()
         err_5m = self._compute_err_5m()
         idem = self._compute_idem()
 
-        # THE FORMULA (immutable weights)
-        omega = (
-                self.W_CVAR * (1 - cvar) +
-                self.W_BETA * (1 - beta) +
-                self.W_ERR * (1 - err_5m) +
-                self.W_IDEM * idem
+        # CVaR + THE FORMULA (immutable weights)
+        cvar, omega = _omega_kernel(
+            recent_scores, self.ALPHA, beta, err_5m, idem,
+            self.W_CVAR, self.W_BETA, self.W_ERR, self.W_IDEM
         )
 
         components = OmegaComponents(
-            cvar=cvar,
+            cvar=float(cvar),
             beta=beta,
             err_5m=err_5m,
             idem=idem,
-            omega=omega
+            omega=float(omega)
         )
 
+        self._cached = (self._dirty, now, components)
+
         return components
 
     def check_gate(self) -> Tuple[bool, OmegaComponents]:
@@ -211,12 +340,21 @@ class OmegaGate:
             - No new files accepted
             - Kill-switch may activate
         """
+        # Fast path: recent high-Ω pass and no errors since
+        hot = self._hot_pass
+        if hot is not None and hot[0] == self._error_epoch and time.monotonic() - hot[1] < self.HOT_TTL:
+            return True, hot[2]
+
         components = self.compute_omega()
 
         passed = components.omega >= self.OMEGA_THRESHOLD
 
-        status = "✅ PASS" if passed else "🔴 FAIL"
-        logger.info(f"Ω-GATE: Ω={components.omega:.3f} {status} (threshold={self.OMEGA_THRESHOLD})")
+        if components.omega > self.HOT_OMEGA:
+            self._hot_pass = (self._error_epoch, time.monotonic(), components)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Ω-GATE: Ω=%.3f %s (threshold=%s)",
+                        components.omega, "✅ PASS" if passed else "🔴 FAIL", self.OMEGA_THRESHOLD)
 
         return passed, components
 
@@ -227,80 +365,103 @@ class OmegaGate:
         Args:
             action_type: Type of action (deploy, mint, sign, etc.)
             confidence: Confidence score 0-1 (1=perfect)
-            metadata: Additional metadata
+            metadata: Additional metadata (kept for recent_actions, not used by Ω)
         """
-        action = {
-            'timestamp': datetime.utcnow().isoformat(),
-            'type': action_type,
-            'confidence': confidence,
-            'metadata': metadata or {}
-        }
-
-        self.action_history.append(action)
-
-        # Keep window size limited
-        if len(self.action_history) > self.WINDOW_SIZE * 2:
-            self.action_history = self.action_history[-self.WINDOW_SIZE:]
+        # Only the timestamp and confidence feed Ω; the ring overwrites the oldest
+        slot = self._actions_total % self.WINDOW_SIZE
+        self._ts[slot] = time.monotonic()
+        self._conf[slot] = confidence
+        self._action_info[slot] = (action_type, metadata)  # Replaces the evicted action's
+        self._actions_total += 1
+        self._dirty += 1
 
     def record_error(self):
         """Record an error event"""
-        self.error_timestamps.append(datetime.utcnow())
+        now = time.monotonic()
+        self.error_timestamps.append(now)
+        self._dirty += 1
+        self._error_epoch += 1
 
-        # Keep last 5 minutes only
-        five_min_ago = datetime.utcnow() - timedelta(minutes=5)
-        self.error_timestamps = [ts for ts in self.error_timestamps if ts >= five_min_ago]
+        # Keep last 5 minutes only (oldest first)
+        five_min_ago = now - self.ERR_WINDOW
+        while self.error_timestamps[0] < five_min_ago:
+            self.error_timestamps.popleft()
 
     def record_validation(self, is_valid: bool):
         """Record a validation result (for β computation)"""
-        self.validation_results.append(is_valid)
+        # Keep the running failure count in step with the deque's eviction
+        if len(self.validation_results) == self.WINDOW_SIZE and not self.validation_results[0]:
+            self.validation_failures -= 1
 
-        # Keep window size limited
-        if len(self.validation_results) > self.WINDOW_SIZE:
-            self.validation_results = self.validation_results[-self.WINDOW_SIZE:]
+        self.validation_results.append(is_valid)
+        if not is_valid:
+            self.validation_failures += 1
+        self._dirty += 1
 
     def record_webhook(self, is_idempotent: bool):
         """Record webhook delivery (for Idem computation)"""
         self.total_webhooks += 1
         if is_idempotent:
             self.idempotent_count += 1
+        self._dirty += 1
+
+    def record_actions_bulk(self, confidences: Sequence[float]):
+        """Record a batch of actions at once (all stamped with the same time)"""
+        confidences = np.asarray(confidences, dtype=np.float64)
+        n = confidences.size
+        if n == 0:
+            return
+
+        # Older entries of an oversized batch would be overwritten anyway
+        keep = min(n, self.WINDOW_SIZE)
+        slots = (self._actions_total + n - keep + np.arange(keep)) % self.WINDOW_SIZE
+        self._ts[slots] = time.monotonic()
+        self._conf[slots] = confidences[n - keep:]
+        if self._action_info:
+            # Bulk actions carry no type/metadata: drop what the overwritten slots had
+            for slot in slots.tolist():
+                self._action_info.pop(slot, None)
+        self._actions_total += n
+        self._dirty += 1
+
+    def record_validations_bulk(self, valid: int, invalid: int):
+        """Record batch validation totals (valid results first, then invalid)"""
+        # Only the last WINDOW_SIZE results survive: clamp before building
+        invalid = min(invalid, self.WINDOW_SIZE)
+        valid = min(valid, self.WINDOW_SIZE - invalid)
+        self.validation_results.extend([True] * valid + [False] * invalid)
+        self.validation_failures = self.validation_results.count(False)
+        self._dirty += 1
+
+    def record_webhooks_bulk(self, total: int, idempotent: int):
+        """Record batch webhook totals (for Idem computation)"""
+        self.total_webhooks += total
+        self.idempotent_count += idempotent
+        self._dirty += 1
 
     def get_status_report(self) -> str:
         """Generate human-readable status report"""
         components = self.compute_omega()
         passed, _ = self.check_gate()
 
-        report = f"""
-╔══════════════════════════════════════════════════════════╗
-║          Ω-OMNIVERSE Confidence Score Report            ║
-╚══════════════════════════════════════════════════════════╝
-
-Formula: Ω = 0.4·(1−CVaRα) + 0.3·(1−β) + 0.2·(1−ERR₅m) + 0.1·Idem
-
-Components:
-  CVaRα (tail risk):        {components.cvar:.4f} → contrib: {self.W_CVAR * (1 - components.cvar):.4f}
-  β (false negative):       {components.beta:.4f} → contrib: {self.W_BETA * (1 - components.beta):.4f}
-  ERR₅m (error rate):       {components.err_5m:.4f} → contrib: {self.W_ERR * (1 - components.err_5m):.4f}
-  Idem (idempotency):       {components.idem:.4f} → contrib: {self.W_IDEM * components.idem:.4f}
-
-Final Score:
-  Ω = {components.omega:.4f}
-
-Gate Status:
-  Threshold: {self.OMEGA_THRESHOLD:.2f}
-  Status: {'✅ OPERATIONAL (Ω ≥ 0.90)' if passed else '🔴 BLOCKED (Ω < 0.90)'}
-
-System State:
-  Actions tracked: {len(self.action_history)}
-  Recent errors (5m): {len(self.error_timestamps)}
-  Total webhooks: {self.total_webhooks}
-  Idempotent: {self.idempotent_count}
-
-{'━' * 60}
-The Ξ-LUA {'HAS PERMISSION' if passed else 'DOES NOT HAVE PERMISSION'} to exist in the next second.
-{'━' * 60}
-        """
-
-        return report
+        return self._REPORT_TEMPLATE.format_map({
+            'cvar': components.cvar,
+            'beta': components.beta,
+            'err_5m': components.err_5m,
+            'idem': components.idem,
+            'omega': components.omega,
+            'cvar_contrib': self.W_CVAR * (1 - components.cvar),
+            'beta_contrib': self.W_BETA * (1 - components.beta),
+            'err_contrib': self.W_ERR * (1 - components.err_5m),
+            'idem_contrib': self.W_IDEM * components.idem,
+            'threshold': self.OMEGA_THRESHOLD,
+            'status': '✅ OPERATIONAL (Ω ≥ 0.90)' if passed else '🔴 BLOCKED (Ω < 0.90)',
+            'actions': self.action_count,
+            'errors': len(self.error_timestamps),
+            'webhooks': self.total_webhooks,
+            'idempotent': self.idempotent_count,
+            'permission': 'HAS PERMISSION' if passed else 'DOES NOT HAVE PERMISSION'
+        })
 
 
 # Singleton instance
@@ -119,6 +119,8 @@ install_python_components() {
     pip3 install --quiet --upgrade pip
     pip3 install --quiet \
         cryptography \
+        orjson \
+        blake3 \
         numpy \
         python-dotenv \
         web3 \
@@ -19,7 +19,13 @@ Part of Ξ-LUA v2.0 SuperProject
 import sys
 import os
 import time
+import copy
+import pickle
 import hashlib
+import tempfile
+import subprocess
+from unittest import mock
+import numpy as np
 from pathlib import Path
 
 # Add parent directory to path
@@ -33,6 +39,9 @@ from core.autoheal.lua_autoheal import (
 )
 from core.stabilizer.stabilizer_recal import StabilizerRecal
 from core.autoheal.unified_monitor import UnifiedMonitor
+from core.metrics.thermodynamic_metrics import ThermodynamicMetrics
+from core.omniverse.omega_gate import OmegaGate
+from core.monetization.omega_pay import PaymentRecord
 
 
 def test_layer_1_key_rotation():
@@ -125,6 +134,7 @@ def test_layer_3_merkle_chain():
         print(f"  ✓ Tampering detection: OK")
 
     # Cleanup
+    logger.close()
     os.unlink(log_file)
 
     return True
@@ -169,7 +179,9 @@ def test_layer_5_antifragility():
     print("│ Layer 5: Antifragility (System Strengthens)            │")
     print("└─────────────────────────────────────────────────────────┘")
 
-    stabilizer = StabilizerRecal(initial_psi=0.90)
+    # Virtual clock (ns): the confirmation window only consults timestamps
+    clock = [0]
+    stabilizer = StabilizerRecal(initial_psi=0.90, now_fn=lambda: clock[0])
 
     initial_psi = stabilizer.state.psi_target
     initial_price = stabilizer.state.price_multiplier
@@ -181,7 +193,7 @@ def test_layer_5_antifragility():
     print(f"  Simulating attack (CVaR=0.20 for 6s)...", end="")
     for _ in range(60):  # 6 seconds at 10 updates/sec
         stabilizer.update_cvar(0.20)
-        time.sleep(0.1)
+        clock[0] += 100_000_000
     print(" done")
 
     final_psi = stabilizer.state.psi_target
@@ -283,6 +295,288 @@ def test_layer_8_zero_dependencies():
     return True
 
 
+def test_state_records_roundtrip():
+    """Test slotted state records survive pickle and deepcopy"""
+    print("\n┌─────────────────────────────────────────────────────────┐")
+    print("│ State Records: pickle / deepcopy round-trip            │")
+    print("└─────────────────────────────────────────────────────────┘")
+
+    state = ThermodynamicMetrics().compute_full_state(
+        omega=0.95, cvar=0.05, cumulative_energy=1e-20, blocks_passed=3
+    )
+
+    assert pickle.loads(pickle.dumps(state)) == state, "ThermodynamicState pickle mismatch"
+    assert copy.deepcopy(state) == state, "ThermodynamicState deepcopy mismatch"
+    print(f"  ✓ ThermodynamicState: OK")
+
+    gate = OmegaGate()
+    gate.record_action("test_action", 0.97)
+    components = gate.compute_omega()
+
+    assert pickle.loads(pickle.dumps(components)) == components, "OmegaComponents pickle mismatch"
+    assert copy.deepcopy(components) == components, "OmegaComponents deepcopy mismatch"
+    print(f"  ✓ OmegaComponents: OK")
+
+    record = PaymentRecord(
+        payment_id="pay_test", transaction_hash="0xabc", payment_method="pix",
+        amount=29.90, confirmed_at="2025-01-01T00:00:00", status="confirmed"
+    )
+
+    assert pickle.loads(pickle.dumps(record)) == record, "PaymentRecord pickle mismatch"
+    assert copy.deepcopy(record) == record, "PaymentRecord deepcopy mismatch"
+    print(f"  ✓ PaymentRecord: OK")
+
+    return True
+
+
+def test_merkle_numpy_metadata():
+    """Test Merkle-chain entries accept numpy values in metadata"""
+    print("\n┌─────────────────────────────────────────────────────────┐")
+    print("│ Merkle-Chain: numpy metadata                           │")
+    print("└─────────────────────────────────────────────────────────┘")
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.log') as f:
+        log_file = f.name
+
+    logger = MerkleChainLogger(log_file=log_file)
+    logger.append("numpy_event", {
+        'cvar': np.float64(0.17),
+        'count': np.int64(3),
+        'flag': np.bool_(True),
+        'ratio': np.float32(0.5)
+    })
+    assert logger.verify_integrity(), "Chain integrity failed"
+    logger.flush()
+    print(f"  ✓ numpy scalars appended")
+
+    reloaded = MerkleChainLogger(log_file=log_file)
+    assert reloaded.chain[-1]['metadata'] == {'cvar': 0.17, 'count': 3, 'flag': True, 'ratio': 0.5}, \
+        "Metadata not restored"
+    assert reloaded.verify_integrity(), "Reloaded chain integrity failed"
+    print(f"  ✓ Reloaded chain integrity: VALID")
+
+    logger.close()
+    reloaded.close()
+    os.unlink(log_file)
+
+    return True
+
+
+def test_kill_switch_exit_flush():
+    """Test coalesced suspicious events reach the chain on normal exit"""
+    print("\n┌─────────────────────────────────────────────────────────┐")
+    print("│ Kill-Switch: coalesced events flushed at exit          │")
+    print("└─────────────────────────────────────────────────────────┘")
+
+    # Exit well inside COALESCE_WINDOW, before the flush timer fires
+    home = tempfile.mkdtemp()
+    script = (
+        "from core.autoheal.lua_autoheal import KillSwitch\n"
+        "KillSwitch(threshold=100).report_suspicious_event('exit_probe')\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True,
+        cwd=str(Path(__file__).parent.parent), env=dict(os.environ, HOME=home)
+    )
+
+    logger = MerkleChainLogger(log_file=os.path.join(home, '.xi-lua', 'autoheal.log'))
+    events = [entry['event'] for entry in logger.chain]
+    logger.close()
+    assert "Suspicious: exit_probe" in events, f"Pending event lost at exit: {events}"
+    print(f"  ✓ Pending event written before exit")
+
+    return True
+
+
+def test_merkle_shared_close():
+    """Test one logger per path, and close() persists and releases it"""
+    print("\n┌─────────────────────────────────────────────────────────┐")
+    print("│ Merkle-Chain: shared logger / close                    │")
+    print("└─────────────────────────────────────────────────────────┘")
+
+    autoheal = LuaAutoHeal()
+    assert autoheal.logger is autoheal.kill_switch.logger is autoheal.key_manager.logger, \
+        "Components opened separate loggers on one log"
+    print(f"  ✓ AutoHeal components share one logger")
+
+    log_file = os.path.join(tempfile.mkdtemp(), 'autoheal.log')
+    logger = MerkleChainLogger.shared(log_file)
+    assert MerkleChainLogger.shared(log_file) is logger, "Second logger for the same path"
+
+    logger.append("before_close", {'value': 1})
+    fsync_thread = logger._fsync_thread
+    logger.close()
+    assert logger.closed and not fsync_thread.is_alive(), "fsync thread still running"
+    try:
+        logger.append("after_close")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Append to closed logger accepted")
+    print(f"  ✓ close(): fsync thread stopped, appends refused")
+
+    reopened = MerkleChainLogger.shared(log_file)
+    assert reopened is not logger, "Closed logger handed out again"
+    assert [e['event'] for e in reopened.chain] == ["before_close"], "Entry lost on close"
+    reopened.close()
+    print(f"  ✓ Reopened log holds the entry")
+
+    return True
+
+
+def test_merkle_corrupt_legacy_log():
+    """Test an unreadable legacy log is moved aside, not appended to"""
+    print("\n┌─────────────────────────────────────────────────────────┐")
+    print("│ Merkle-Chain: corrupt legacy log                       │")
+    print("└─────────────────────────────────────────────────────────┘")
+
+    log_dir = tempfile.mkdtemp()
+    log_file = os.path.join(log_dir, 'autoheal.log')
+    corrupt = b'{"timestamp": "2025-01-01T00:00:00", "event": "ok"\nnot json at all\n'
+    with open(log_file, 'wb') as f:
+        f.write(corrupt)
+
+    logger = MerkleChainLogger(log_file=log_file)
+    assert logger.chain == [], "Corrupt entries loaded"
+    with open(log_file + '.corrupt', 'rb') as f:
+        assert f.read() == corrupt, "Corrupt log not preserved"
+    print(f"  ✓ Corrupt log moved aside: {log_file}.corrupt")
+
+    logger.append("after_corruption", {'value': 1})
+    logger.close()
+
+    reloaded = MerkleChainLogger(log_file=log_file)
+    assert len(reloaded.chain) == 1, "Fresh log not readable"
+    assert reloaded.verify_integrity(), "Fresh chain integrity failed"
+    reloaded.close()
+    print(f"  ✓ Fresh binary log: VALID")
+
+    # Log cannot be moved aside (read-only / cross-device): start in memory
+    stuck_file = os.path.join(log_dir, 'stuck.log')
+    with open(stuck_file, 'wb') as f:
+        f.write(corrupt)
+    with mock.patch('os.replace', side_effect=OSError(30, 'Read-only file system')):
+        stuck = MerkleChainLogger(log_file=stuck_file)
+    stuck.append("in_memory", {'value': 2})
+    stuck.close()
+    assert len(stuck.chain) == 1 and stuck.verify_integrity(), "In-memory chain broken"
+    with open(stuck_file, 'rb') as f:
+        assert f.read() == corrupt, "Unmovable corrupt log was written to"
+    print(f"  ✓ Unmovable log: untouched, chain kept in memory")
+
+    return True
+
+
+def test_omega_cvar_tail():
+    """Test partitioned CVaR tail matches the sorted-tail definition"""
+    print("\n┌─────────────────────────────────────────────────────────┐")
+    print("│ Ω-Gate: CVaR tail (partition vs sort)                  │")
+    print("└─────────────────────────────────────────────────────────┘")
+
+    gate = OmegaGate()
+    rng = np.random.default_rng(7)
+
+    for _ in range(300):
+        scores = rng.random(int(rng.integers(1, 101))).tolist()
+
+        # Reference: mean of the worst α fraction of sorted losses
+        losses = sorted((1.0 - score for score in scores), reverse=True)
+        expected = float(np.mean(losses[:max(1, int(len(losses) * gate.ALPHA))]))
+
+        # Partition sums the tail in another order: allow 2 ulp
+        cvar = gate._compute_cvar(scores)
+        assert abs(cvar - expected) <= 2 * np.spacing(expected), \
+            f"CVaR {cvar!r} != {expected!r}"
+
+    print(f"  ✓ 300 random windows within 2 ulp")
+
+    return True
+
+
+def test_omega_action_audit():
+    """Test action type/metadata survive until their ring slot is reused"""
+    print("\n┌─────────────────────────────────────────────────────────┐")
+    print("│ Ω-Gate: Action Type / Metadata Audit                   │")
+    print("└─────────────────────────────────────────────────────────┘")
+
+    gate = OmegaGate()
+    gate.record_action("deploy", 0.97, metadata={"tx": "0xabc"})
+    gate.record_action("mint", 0.99)
+
+    actions = gate.recent_actions()
+    assert [a['type'] for a in actions] == ["deploy", "mint"], "Action types lost"
+    assert actions[0]['metadata'] == {"tx": "0xabc"}, "Metadata lost"
+    assert actions[1]['metadata'] is None, "Metadata leaked across actions"
+    print(f"  ✓ Type and metadata kept per action")
+
+    # Overwrite every slot: the side table must not outgrow the ring
+    gate.record_actions_bulk([1.0] * gate.WINDOW_SIZE)
+    assert not gate._action_info, "Evicted action info kept"
+    assert all(a['type'] is None for a in gate.recent_actions()), "Stale type reported"
+    print(f"  ✓ Info evicted with its slot")
+
+    return True
+
+
+def test_stabilizer_sample_cvar():
+    """Test from_sample_losses matches the sorted-tail definition"""
+    print("\n┌─────────────────────────────────────────────────────────┐")
+    print("│ Stabilizer: Sample CVaR (partition vs sort)            │")
+    print("└─────────────────────────────────────────────────────────┘")
+
+    rng = np.random.default_rng(11)
+
+    for beta in (0.9, 0.95, 0.99):
+        losses = rng.random(100)
+
+        # Reference: mean of the worst round(n * (1 - β)) sorted losses
+        tail = int(round(losses.size * (1 - beta)))
+        expected = float(np.mean(np.sort(losses)[::-1][:tail]))
+
+        cvar = StabilizerRecal.from_sample_losses(losses, beta=beta)
+        assert abs(cvar - expected) <= 2 * np.spacing(expected), \
+            f"β={beta}: CVaR {cvar!r} != {expected!r} (worst {tail})"
+        print(f"  ✓ n=100, β={beta}: mean of worst {tail}")
+
+    return True
+
+
+def test_stabilizer_timestamps():
+    """Test float clocks and timestamps are rejected, ns accepted"""
+    print("\n┌─────────────────────────────────────────────────────────┐")
+    print("│ Stabilizer: Timestamps (ns only)                       │")
+    print("└─────────────────────────────────────────────────────────┘")
+
+    cvars = np.full(60, 0.20)
+    seconds = np.arange(60) * 0.1
+    nanos = np.arange(60, dtype=np.int64) * 100_000_000
+
+    for ingest in ("update_cvar_batch", "replay_cvar_trace"):
+        stabilizer = StabilizerRecal(initial_psi=0.90, now_fn=lambda: 0)
+        try:
+            getattr(stabilizer, ingest)(cvars, seconds)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError(f"{ingest} accepted float seconds")
+        assert stabilizer.state.psi_target == 0.90, "Rejected batch mutated state"
+
+        triggered = getattr(stabilizer, ingest)(cvars, nanos)
+        assert np.any(triggered), f"{ingest} did not recalibrate on ns input"
+        print(f"  ✓ {ingest}: float rejected, ns recalibrated")
+
+    # A float-seconds clock would keep every sample forever
+    try:
+        StabilizerRecal(now_fn=time.monotonic)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("float now_fn accepted")
+    print(f"  ✓ now_fn=time.monotonic rejected")
+
+    return True
+
+
 def test_unified_integration():
     """Test Unified Monitor Integration"""
     print("\n┌─────────────────────────────────────────────────────────┐")
@@ -330,6 +624,15 @@ def main():
         ("Layer 6: Quantum-Resistant", test_layer_6_quantum_resistant),
         ("Layer 7: Thermodynamic Proof", test_layer_7_thermodynamic_proof),
         ("Layer 8: Zero Dependencies", test_layer_8_zero_dependencies),
+        ("State Records Round-trip", test_state_records_roundtrip),
+        ("Merkle numpy Metadata", test_merkle_numpy_metadata),
+        ("Merkle Shared Logger / Close", test_merkle_shared_close),
+        ("Kill-Switch Exit Flush", test_kill_switch_exit_flush),
+        ("Merkle Corrupt Legacy Log", test_merkle_corrupt_legacy_log),
+        ("Omega CVaR Tail", test_omega_cvar_tail),
+        ("Omega Action Audit", test_omega_action_audit),
+        ("Stabilizer Sample CVaR", test_stabilizer_sample_cvar),
+        ("Stabilizer ns Timestamps", test_stabilizer_timestamps),
         ("Integration Test", test_unified_integration),
     ]
 